@@ -146,8 +146,8 @@ def wrestler_of_the_year(year_end, activity):
     for y in sorted(year_end):
         ranking = year_end[y]
         rate_now = {r['name']: r['rating'] for r in ranking}
-        eligible = [r for r in ranking
-                    if activity.get(y, {}).get(r['name'], 0) >= MIN_YEAR_BOUTS]
+        bouts = activity.get(y, {})
+        eligible = [r for r in ranking if bouts.get(r['name'], 0) >= MIN_YEAR_BOUTS]
         if eligible:
             def gain(r):
                 return r['rating'] - prev_rating.get(r['name'], elo.BASE_RATING)
@@ -167,13 +167,16 @@ def most_improved(year_end, activity):
     for y in sorted(year_end):
         ranking = year_end[y]
         rate_now = {r['name']: r['rating'] for r in ranking}
-        eligible = [r for r in ranking
-                    if activity.get(y, {}).get(r['name'], 0) >= MIN_YEAR_BOUTS
-                    and r['name'] in prev_rating]
+        bouts = activity.get(y, {})
+        # The gain is worked out once, in the eligibility pass, and carried to
+        # the winner rather than recomputed for the max and again for the row.
+        eligible = [(r['rating'] - prev_rating[r['name']], r) for r in ranking
+                    if r['name'] in prev_rating
+                    and bouts.get(r['name'], 0) >= MIN_YEAR_BOUTS]
         if eligible:
-            best = max(eligible, key=lambda r: r['rating'] - prev_rating[r['name']])
+            gain, best = max(eligible, key=lambda t: t[0])
             w = dict(best)
-            w['gain'] = best['rating'] - prev_rating[best['name']]
+            w['gain'] = gain
             out[y] = w
         prev_rating = rate_now
     return out
@@ -422,9 +425,17 @@ def _replace_between(text, start, end, block):
     return None
 
 
+def _write_if_changed(path, html, original):
+    """Write html to path unless it is what the file already holds, so a re-run
+    with nothing new leaves the pages (and their mtimes) alone."""
+    if html != original:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(html)
+
+
 def write_ring_awards(year_end, woty, improved, hand):
     with open(RING_HTML, encoding='utf-8') as f:
-        html = f.read()
+        html = original = f.read()
     auto = render_auto(year_end, woty, improved, hand)
 
     # 1) Auto section — always refreshed.
@@ -445,8 +456,7 @@ def write_ring_awards(year_end, woty, improved, hand):
         if HAND_START not in html:
             html = html.replace(AUTO_END, AUTO_END + '\n\n' + render_hand_template(), 1)
 
-    with open(RING_HTML, 'w', encoding='utf-8') as f:
-        f.write(html)
+    _write_if_changed(RING_HTML, html, original)
     nw = len(woty['men']) + len(woty['women'])
     nl = len(year_end['men']) + len(year_end['women'])
     print(f"  ✓ The Ring awards written ({nw} WOTY, {nl} year-end top-{TOP_N} lists)")
@@ -610,14 +620,13 @@ def inject_wrestler_awards(year_end, woty, improved, picks, hand):
         slug = os.path.basename(path)[:-5]
         items = acc.get(slug)
         with open(path, encoding='utf-8') as f:
-            html = f.read()
+            html = original = f.read()
         # Remove any stale block first (update.py may re-emit the page fresh).
         if WA_START in html and WA_END in html:
             html = (html[:html.index(WA_START)]
                     + html[html.index(WA_END) + len(WA_END):]).rstrip('\n') + '\n'
         if not items:
-            with open(path, 'w', encoding='utf-8') as f:
-                f.write(html)
+            _write_if_changed(path, html, original)
             continue
         block = render_wrestler_block(items)
         # Insert just after the "Titles in Wrestling" section if present, else
@@ -629,8 +638,7 @@ def inject_wrestler_awards(year_end, woty, improved, picks, hand):
             html = html.replace('<!-- MATCHES_END -->', block + '\n<!-- MATCHES_END -->', 1)
         else:
             html = html.replace('</body>', block + '\n</body>', 1)
-        with open(path, 'w', encoding='utf-8') as f:
-            f.write(html)
+        _write_if_changed(path, html, original)
         touched += 1
     print(f"  ✓ Injected accolades into {touched} wrestler page(s)")
 
@@ -643,9 +651,11 @@ def collect_record_leaders():
     (update.py fills the stat tables, elo.py fills the rating ones). Two-wrestler
     matchup tables (Biggest Upsets / Highest Matches by Rating) have no single
     record-holder and are skipped."""
-    if not os.path.exists(RECORDS_HTML):
+    try:
+        with open(RECORDS_HTML, encoding='utf-8') as f:
+            html = f.read()
+    except FileNotFoundError:
         return {}
-    html = open(RECORDS_HTML, encoding='utf-8').read()
     leaders = defaultdict(list)
     for tbl in re.findall(
             r'<table class="p4p-rank record-table">.*?</table>', html, re.S):
@@ -690,7 +700,7 @@ def inject_wrestler_records():
     for path in glob.glob(os.path.join(WRESTLERS_DIR, '*.html')):
         slug = os.path.basename(path)[:-5]
         with open(path, encoding='utf-8') as f:
-            html = f.read()
+            html = original = f.read()
         # Drop any stale block first so re-runs stay idempotent.
         if WREC_START in html and WREC_END in html:
             html = (html[:html.index(WREC_START)]
@@ -698,8 +708,7 @@ def inject_wrestler_records():
             html = re.sub(r'\n{3,}', '\n\n', html)
         items = leaders.get(slug)
         if not items:
-            with open(path, 'w', encoding='utf-8') as f:
-                f.write(html)
+            _write_if_changed(path, html, original)
             continue
         block = render_records_block(items)
         if WA_END in html:                     # right after Awards and honors
@@ -710,8 +719,7 @@ def inject_wrestler_records():
                 html = html[:anchor.start()] + block + '\n\n' + html[anchor.start():]
             else:
                 html = html.replace('</body>', block + '\n</body>', 1)
-        with open(path, 'w', encoding='utf-8') as f:
-            f.write(html)
+        _write_if_changed(path, html, original)
         touched += 1
     print(f"  ✓ Injected records into {touched} wrestler page(s)")
 
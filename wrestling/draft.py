@@ -207,6 +207,10 @@ def _deposed_champions(db, season_start, all_champ_names):
         for weight in WEIGHT_ORDER:
             reigns = db.championships[org].get(weight) or []
             for i, reign in enumerate(reigns):
+                # Cheapest test first: anyone still holding a belt is out
+                # before their reign's end is even looked up.
+                if reign['champion'] in all_champ_names:
+                    continue                       # still holds a belt somewhere
                 nxt = reigns[i + 1] if i + 1 < len(reigns) else None
                 if reign.get('vacancy_date'):
                     lost_on, lost_to = reign['vacancy_date'], None
@@ -217,8 +221,6 @@ def _deposed_champions(db, season_start, all_champ_names):
                 when = elo._parse_date(lost_on)
                 if season_start and when and when < season_start:
                     continue
-                if reign['champion'] in all_champ_names:
-                    continue                       # still holds a belt elsewhere
                 out[(org, weight)].append({'name': reign['champion'],
                                            'country': reign.get('country', 'un'),
                                            'lost_on': lost_on, 'lost_to': lost_to})
@@ -243,11 +245,11 @@ def callups_path(year):
 def load_callups(year):
     if not year:
         return []
-    path = callups_path(year)
-    if not os.path.exists(path):
+    try:
+        with open(callups_path(year), encoding='utf-8') as f:
+            return [r for r in csv.DictReader(f) if (r.get('name') or '').strip()]
+    except FileNotFoundError:
         return []
-    with open(path, encoding='utf-8') as f:
-        return [r for r in csv.DictReader(f) if (r.get('name') or '').strip()]
 
 
 def append_callup(year, row):
@@ -793,10 +795,11 @@ def inject_org_rankings():
     if not rows:
         # No draft has been run — make sure no stale rankings linger.
         for org, path in ORG_PAGES.items():
-            if not os.path.exists(path):
+            try:
+                with open(path, encoding='utf-8') as f:
+                    html = f.read()
+            except FileNotFoundError:
                 continue
-            with open(path, encoding='utf-8') as f:
-                html = f.read()
             new = _strip_block(html, RANK_START, RANK_END)
             if new != html:
                 with open(path, 'w', encoding='utf-8') as f:
@@ -841,10 +844,11 @@ def inject_org_rankings():
                 backfill[(org, div)] = take
 
     for org, path in ORG_PAGES.items():
-        if not os.path.exists(path):
+        try:
+            with open(path, encoding='utf-8') as f:
+                html = f.read()
+        except FileNotFoundError:
             continue
-        with open(path, encoding='utf-8') as f:
-            html = f.read()
         block = render_org_rankings(org, rows, champ_of, ratings, months,
                                     rating_by_month, record_by_name,
                                     backfill, all_champ_names, callups, deposed)
@@ -1190,7 +1194,7 @@ def book_singles_contenders(quiet=False):
                 return row
             # A part-filled row still comes out top-5 vs bottom-5: take from the
             # half that isn't represented yet. Last resort, anyone in the division.
-            order = [bt, tp] if here & {x[1] for x in tp} else [tp, bt]
+            order = [bt, tp] if any(x[1] in here for x in tp) else [tp, bt]
             for bucket in order + [tp + bt]:
                 if len(queue) >= slots:
                     break
@@ -42,14 +42,21 @@ and how decisively it ended (a countout moves the needle less than a pinfall).
 """
 
 import os
+import pickle
 import re
 import sys
+from bisect import bisect_left
 from collections import defaultdict
 from datetime import datetime
+from functools import lru_cache
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, SCRIPT_DIR)
 from update import WrestlingDatabase, resolve_site_date, format_site_date
+# The same date parser (and cache) the database itself uses: the replays here
+# ask about exactly the strings the parse already saw, so whenever the lists
+# were parsed this run rather than unpickled, they start warm.
+from update import _parse_date
 
 # =============================================================================
 # CONSTANTS
@@ -108,21 +115,25 @@ HOF_RETIREMENT_YEARS = 5
 HOF_REQUIRE_MAJOR    = True
 
 P4P_DIR = 'wrestling/p4p'
+WRESTLERS_DIR = 'wrestling/wrestlers'
 
 
 # =============================================================================
 # HELPERS
 # =============================================================================
 
-def _parse_date(s):
-    if not s:
-        return None
-    for fmt in ("%B %d, %Y", "%B %Y", "%b %d, %Y", "%b %Y"):
-        try:
-            return datetime.strptime(s.strip(), fmt)
-        except (ValueError, AttributeError):
-            pass
-    return None
+# A few dozen distinct spellings cover every match, so lower-case each one
+# once and hand back the same string (and division index) from then on.
+@lru_cache(maxsize=None)
+def _weight_class(raw):
+    return (raw or '').lower()
+
+
+@lru_cache(maxsize=None)
+def _weight_index(raw):
+    """Division index (0 = heaviest) for a raw weight class, None if it is not
+    one of WEIGHT_ORDER."""
+    return WEIGHT_INDEX.get(_weight_class(raw))
 
 
 def _month_key(d):
@@ -137,11 +148,14 @@ def _months_before(key, n):
     return f"{total // 12:04d}-{total % 12 + 1:02d}"
 
 
+@lru_cache(maxsize=None)
 def _month_label(key):
     y, m = key.split('-')
     return f"{datetime(int(y), int(m), 1):%B} {y}"
 
 
+# A few dozen country codes, each drawn on row after row of every table.
+@lru_cache(maxsize=None)
 def flag(country):
     return f'<span class="fi fi-{country}"></span>'
 
@@ -150,10 +164,16 @@ def _page_name(name):
     return name.lower().replace(' ', '-').replace('.', '')
 
 
+# The same few hundred names fill every monthly table in the archive, so build
+# each link once.
+@lru_cache(maxsize=None)
 def _wlink(name):
     return f'<a href="/wrestling/wrestlers/{_page_name(name)}.html">{name}</a>'
 
 
+# Finish methods are a handful of fixed phrases, and every replay classifies
+# each bout again, so remember the answer per phrase.
+@lru_cache(maxsize=None)
 def _method_class(method):
     m = (method or '').lower()
     if 'pinfall' in m:
@@ -192,13 +212,36 @@ def k_factor(db, match):
     k = K_BASE * METHOD_WEIGHT[_method_class(match.get('method'))]
     if _is_title_match(db, match):
         k *= K_TITLE
-    elif (match.get('weight_class') or '').lower() == 'openweight':
+    elif _weight_class(match.get('weight_class')) == 'openweight':
         k *= K_OPENWEIGHT
     return k
 
 
+def _count_division(div_counts, division, name, wi):
+    """Tally one bout at division index wi for name, keeping division[name]
+    (their most-fought division, ties going heavier) current as it goes.
+    Only one count moves per bout, so the leader is either the old one or wi;
+    nothing needs rescanning."""
+    counts = div_counts[name]
+    counts[wi] += 1
+    cur = division.get(name)
+    if cur is None or (counts[wi], -wi) > (counts[cur], -cur):
+        division[name] = wi
+
+
+_SINGLES = None     # (db, singles_matches(db)) for the db last asked about
+
+
 def singles_matches(db):
-    """Every singles match with a result, in chronological order."""
+    """Every singles match with a result, in chronological order.
+
+    Every replay (snapshots, peaks, current ratings, the records extras) and
+    awards / draft start from this list, so the dates are parsed and the bouts
+    sorted once per db rather than once per caller. Read-only, like
+    build_snapshots' result."""
+    global _SINGLES
+    if _SINGLES is not None and _SINGLES[0] is db:
+        return _SINGLES[1]
     out = []
     for event in db.events:
         for m in event['matches']:
@@ -209,6 +252,34 @@ def singles_matches(db):
                 continue
             out.append((d, m))
     out.sort(key=lambda t: (t[0], t[1].get('match_num', 0)))
+    _SINGLES = (db, out)
+    return out
+
+
+_DIVISIONS = None   # (db, match_divisions(db)), memoised like _SINGLES
+
+
+def match_divisions(db):
+    """(idx_a, idx_b) for each bout in singles_matches(db): both wrestlers'
+    most-fought division as of that bout, the bout itself included (None until
+    they have one).
+
+    Every replay needs the same running tally, so it is kept once per db here
+    rather than re-counted by each of them."""
+    global _DIVISIONS
+    if _DIVISIONS is not None and _DIVISIONS[0] is db:
+        return _DIVISIONS[1]
+    div_counts = defaultdict(lambda: defaultdict(int))
+    division = {}
+    out = []
+    for _when, m in singles_matches(db):
+        a, b = m['fighter1'], m['fighter2']
+        wi = _weight_index(m.get('weight_class'))
+        if wi is not None:
+            _count_division(div_counts, division, a, wi)
+            _count_division(div_counts, division, b, wi)
+        out.append((division.get(a), division.get(b)))
+    _DIVISIONS = (db, out)
     return out
 
 
@@ -239,24 +310,52 @@ def classify_genders(db):
     women = set()
     for event in db.events:
         for m in event['matches']:
-            if (m.get('weight_class') or '').lower() in WOMENS_WEIGHTS:
+            if _weight_class(m.get('weight_class')) in WOMENS_WEIGHTS:
                 women.add(m['fighter1'])
                 women.add(m['fighter2'])
     men = set(db.wrestlers) - women
     return men, women
 
 
+# The last (db, (months, snapshots)) build_snapshots produced. Within one
+# update.py run elo.run and then awards.run both want the replay for the same,
+# already-final database; the second gets the first's result.
+_SNAPSHOTS = None
+
+
 def build_snapshots(db):
     """Replay every match, snapshotting the standings at each month end.
 
     Returns (months, snapshots) where months is the ordered list of month keys
     and snapshots maps month key -> {'men': [...], 'women': [...]}; each entry
     is a full ranking list (not just the top 10) of dicts.
+
+    This is one pass on purpose. Unlike the old yearly tables, no month can be
+    worked out on its own: its ratings are the previous month's plus that
+    month's bouts, so there is nothing to hand to a process pool, and the
+    whole replay takes a few milliseconds anyway.
+
+    Memoised on the db object (see _SNAPSHOTS); callers treat the result as
+    read-only, and a db is not changed once it is being ranked.
     """
+    global _SNAPSHOTS
+    if _SNAPSHOTS is not None and _SNAPSHOTS[0] is db:
+        return _SNAPSHOTS[1]
+    result = _replay_snapshots(db)
+    _SNAPSHOTS = (db, result)
+    return result
+
+
+def _replay_snapshots(db):
     men, women = classify_genders(db)
     matches = singles_matches(db)
     if not matches:
         return [], {}
+    # Only PPV wrestlers are ever ranked, and their flags don't change from
+    # month to month: narrow the fields and look the flags up once here rather
+    # than for every wrestler in every monthly table.
+    men, women = men & db.ppv_wrestlers, women & db.ppv_wrestlers
+    country = {name: db.wrestlers[name].get('country', 'un') for name in men | women}
 
     ratings = defaultdict(lambda: BASE_RATING)
     bouts   = defaultdict(int)
@@ -268,31 +367,25 @@ def build_snapshots(db):
     # who was active THEN, not who is active now.
     appear = appearance_months(db)
     appear_keys = sorted(appear)
-    last_seen, appear_i = {}, 0
+    appear_i = 0
     # Divisions fought so far, so a wrestler's division reflects the date of
-    # the snapshot rather than where they ended up years later.
-    div_counts = defaultdict(lambda: defaultdict(int))
+    # the bout rather than where they ended up years later (see
+    # match_divisions; one entry per bout, in step with matches).
+    divisions = match_divisions(db)
 
-    def division_index(name):
-        counts = div_counts.get(name)
-        if not counts:
-            return None
-        # Most-fought division; ties break heavier (lower index).
-        return WEIGHT_INDEX[min(counts, key=lambda w: (-counts[w], WEIGHT_INDEX[w]))]
-
-    def rank_list(names, as_of):
-        cutoff = _months_before(as_of, ACTIVE_MONTHS - 1)
+    def rank_list(names, active):
         rows = []
-        for name in sorted(names):
-            if bouts[name] < MIN_BOUTS or name not in db.ppv_wrestlers:
+        # Only the wrestlers active this month are looked at, not everyone who
+        # ever wrestled. No need to walk them in order either: the sort below
+        # is total (names are unique).
+        for name in names & active:
+            if bouts[name] < MIN_BOUTS:
                 continue
-            if last_seen.get(name, '') < cutoff:
-                continue          # inactive: no match in the last ACTIVE_MONTHS
             rows.append({
                 'name':    name,
                 'rating':  ratings[name],
                 'record':  f"{wins[name]}-{losses[name]}-{draws[name]}",
-                'country': db.wrestlers[name].get('country', 'un'),
+                'country': country[name],
             })
         # Rating desc, then name for a stable order between equal ratings.
         rows.sort(key=lambda r: (-r['rating'], r['name']))
@@ -311,13 +404,7 @@ def build_snapshots(db):
             when, m = matches[idx_m]
             last_date = when
             a, b = m['fighter1'], m['fighter2']
-
-            wc = (m.get('weight_class') or '').lower()
-            if wc in WEIGHT_INDEX:
-                div_counts[a][wc] += 1
-                div_counts[b][wc] += 1
-
-            idx_a, idx_b = division_index(a), division_index(b)
+            idx_a, idx_b = divisions[idx_m]
             ra, rb = ratings[a], ratings[b]
             ea = expected_score(ra, rb, idx_a, idx_b)
             k  = k_factor(db, m)
@@ -341,15 +428,17 @@ def build_snapshots(db):
             bouts[b] += 1
             idx_m += 1
 
+        # Active = wrestled (singles or not) in one of the last ACTIVE_MONTHS
+        # months up to this one: the union of those months' appearances.
         while appear_i < len(appear_keys) and appear_keys[appear_i] <= key:
-            for n in appear[appear_keys[appear_i]]:
-                last_seen[n] = appear_keys[appear_i]
             appear_i += 1
+        lo = bisect_left(appear_keys, _months_before(key, ACTIVE_MONTHS - 1), 0, appear_i)
+        active = set().union(*(appear[k] for k in appear_keys[lo:appear_i]))
 
         months.append(key)
         snapshots[key] = {
-            'men':   rank_list(men, key),
-            'women': rank_list(women, key),
+            'men':   rank_list(men, active),
+            'women': rank_list(women, active),
             # Every rating as it stood that month, nobody filtered out. The
             # published lists drop the inactive and the barely-debuted; the
             # org-page movement arrows compare a fixed division field against
@@ -366,16 +455,21 @@ def build_snapshots(db):
     return months, snapshots
 
 
-def movement(snapshots, months, key, gender, name):
-    """(kind, places) of a wrestler's move since the previous archived month."""
+def previous_ranks(snapshots, months, key, gender):
+    """name -> rank in the archived month before key ({} for the first), built
+    once per table rather than once per row."""
     i = months.index(key)
     if i == 0:
-        return ('new', 0)
-    prev = {r['name']: r['rank'] for r in snapshots[months[i - 1]][gender]}
+        return {}
+    return {r['name']: r['rank'] for r in snapshots[months[i - 1]][gender]}
+
+
+def movement(prev, name, rank):
+    """(kind, places) of a wrestler's move since the previous archived month,
+    given that month's previous_ranks and their rank now."""
     if name not in prev:
         return ('new', 0)
-    cur = next(r['rank'] for r in snapshots[key][gender] if r['name'] == name)
-    delta = prev[name] - cur
+    delta = prev[name] - rank
     if delta > 0:
         return ('up', delta)
     if delta < 0:
@@ -416,8 +510,9 @@ def ranking_table(db, snapshots, months, key, gender, label, top_n=TOP_N):
     ]
     if not rows:
         out.append('        <tr><td colspan="5">No ranked wrestlers.</td></tr>')
+    prev = previous_ranks(snapshots, months, key, gender)
     for r in rows:
-        kind, places = movement(snapshots, months, key, gender, r['name'])
+        kind, places = movement(prev, r['name'], r['rank'])
         out += [
             '        <tr>',
             f'            <th>{r["rank"]}</th>',
@@ -454,9 +549,20 @@ PAGE_FOOT = """
 """
 
 
-def write_month_page(db, snapshots, months, key):
+def _write_page(path, title, body):
+    """Write a standalone p4p/ page: PAGE_HEAD, the body lines joined by
+    newlines, PAGE_FOOT. Handed to the file piece by piece rather than glued
+    into one page-sized string first (the file object buffers the writes)."""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(PAGE_HEAD.replace('__TITLE__', title))
+        f.write(body[0])
+        f.writelines('\n' + line for line in body[1:])
+        f.write(PAGE_FOOT)
+
+
+def write_month_page(db, snapshots, months, i):
+    key = months[i]
     label = _month_label(key)
-    i = months.index(key)
     prev_link = (f'<a href="/wrestling/p4p/{months[i-1]}.html">&#8592; '
                  f'{_month_label(months[i-1])}</a>') if i > 0 else ''
     next_link = (f'<a href="/wrestling/p4p/{months[i+1]}.html">'
@@ -478,11 +584,7 @@ def write_month_page(db, snapshots, months, key):
         '<a href="/wrestling/org/ring.html">The Ring</a></p>',
     ]
 
-    html = (PAGE_HEAD.replace('__TITLE__', f'{label} P4P Rankings')
-            + '\n'.join(body) + PAGE_FOOT)
-    path = f'{P4P_DIR}/{key}.html'
-    with open(path, 'w', encoding='utf-8') as f:
-        f.write(html)
+    _write_page(f'{P4P_DIR}/{key}.html', f'{label} P4P Rankings', body)
 
 
 def write_index_page(db, snapshots, months):
@@ -530,10 +632,7 @@ def write_index_page(db, snapshots, months):
         '        </tr>',
     ] + rows + ['    </table>']
 
-    html = (PAGE_HEAD.replace('__TITLE__', 'P4P Rankings Archive')
-            + '\n'.join(body) + PAGE_FOOT)
-    with open(f'{P4P_DIR}/index.html', 'w', encoding='utf-8') as f:
-        f.write(html)
+    _write_page(f'{P4P_DIR}/index.html', 'P4P Rankings Archive', body)
 
 
 def generate_ring_html(db, snapshots, months):
@@ -584,22 +683,11 @@ def peak_elo(db):
     """name -> highest rating ever reached (needs its own replay)."""
     peaks = defaultdict(lambda: BASE_RATING)
     ratings = defaultdict(lambda: BASE_RATING)
-    div_counts = defaultdict(lambda: defaultdict(int))
-
-    def division_index(name):
-        counts = div_counts.get(name)
-        if not counts:
-            return None
-        return WEIGHT_INDEX[min(counts, key=lambda w: (-counts[w], WEIGHT_INDEX[w]))]
 
-    for when, m in singles_matches(db):
+    for (when, m), (idx_a, idx_b) in zip(singles_matches(db), match_divisions(db)):
         a, b = m['fighter1'], m['fighter2']
-        wc = (m.get('weight_class') or '').lower()
-        if wc in WEIGHT_INDEX:
-            div_counts[a][wc] += 1
-            div_counts[b][wc] += 1
         ra, rb = ratings[a], ratings[b]
-        ea = expected_score(ra, rb, division_index(a), division_index(b))
+        ea = expected_score(ra, rb, idx_a, idx_b)
         k = k_factor(db, m)
         sa = 0.5 if m.get('is_draw') else (1.0 if m['winner'] == a else 0.0)
         ratings[a] = ra + k * (sa - ea)
@@ -616,22 +704,11 @@ def current_ratings(db):
     rankings; those with fewer still get a usable rating for the draft board."""
     ratings = defaultdict(lambda: BASE_RATING)
     bouts = defaultdict(int)
-    div_counts = defaultdict(lambda: defaultdict(int))
-
-    def division_index(name):
-        counts = div_counts.get(name)
-        if not counts:
-            return None
-        return WEIGHT_INDEX[min(counts, key=lambda w: (-counts[w], WEIGHT_INDEX[w]))]
 
-    for when, m in singles_matches(db):
+    for (when, m), (idx_a, idx_b) in zip(singles_matches(db), match_divisions(db)):
         a, b = m['fighter1'], m['fighter2']
-        wc = (m.get('weight_class') or '').lower()
-        if wc in WEIGHT_INDEX:
-            div_counts[a][wc] += 1
-            div_counts[b][wc] += 1
         ra, rb = ratings[a], ratings[b]
-        ea = expected_score(ra, rb, division_index(a), division_index(b))
+        ea = expected_score(ra, rb, idx_a, idx_b)
         k = k_factor(db, m)
         sa = 0.5 if m.get('is_draw') else (1.0 if m['winner'] == a else 0.0)
         ratings[a] = ra + k * (sa - ea)
@@ -641,83 +718,118 @@ def current_ratings(db):
     return dict(ratings), dict(bouts)
 
 
-def last_match_year(db, name):
-    years = [_parse_date(m.get('date')).year
-             for m in db.wrestlers[name]['matches']
-             if _parse_date(m.get('date'))]
-    return max(years) if years else 0
-
-
-def first_match_year(db, name):
-    years = [_parse_date(m.get('date')).year
-             for m in db.wrestlers[name]['matches']
-             if _parse_date(m.get('date'))]
-    return min(years) if years else 0
+def career_years(db):
+    """name -> (first, last) year with a dated match, (0, 0) if none. One walk
+    of every wrestler's matches, shared by the induction pass (retirement) and
+    the HoF rows (debut / retired), rather than two scans per wrestler."""
+    out = {}
+    for name, w in db.wrestlers.items():
+        years = [d.year for d in (_parse_date(m.get('date')) for m in w['matches']) if d]
+        out[name] = (min(years), max(years)) if years else (0, 0)
+    return out
 
 
-def all_titles_str(db, name):
-    parts = []
+def titles_by_champion(db):
+    """name -> {(org, weight): None, ...} for every title they have held, in
+    ALL_ORGS / WEIGHT_ORDER order (a dict used as an ordered set, so repeat
+    reigns collapse without a scan). One walk of db.championships, rather than
+    one per wrestler looked up."""
+    out = defaultdict(dict)
     for org in ALL_ORGS:
         for weight in WEIGHT_ORDER:
             for reign in db.championships[org][weight]:
-                if reign['champion'] != name:
-                    continue
-                label = '<i>The Ring</i>' if org == 'ring' else org.upper()
-                txt = f"{label} {weight.capitalize()}"
-                if txt not in parts:
-                    parts.append(txt)
-    return ' <br> '.join(parts)
-
-
-def read_infobox_height(name):
-    path = f'wrestling/wrestlers/{_page_name(name)}.html'
-    if not os.path.exists(path):
-        return ''
-    content = open(path, encoding='utf-8').read()
-    m = re.search(r'<th>Billed height</th>\s*<td>(.*?)</td>', content, re.DOTALL)
-    return m.group(1).strip() if m else ''
-
-
-def compute_hof_classes(db, peaks):
-    years = sorted({_parse_date(e['date']).year for e in db.events
-                    if _parse_date(e.get('date'))})
+                out[reign['champion']][(org, weight)] = None
+    return out
+
+
+_TITLE_LABEL = {(org, weight): f"{'<i>The Ring</i>' if org == 'ring' else org.upper()} "
+                               f"{weight.capitalize()}"
+                for org in ALL_ORGS for weight in WEIGHT_ORDER}
+
+
+def all_titles_str(held):
+    return ' <br> '.join(_TITLE_LABEL[t] for t in held)
+
+
+def read_wrestler_pages():
+    """page filename -> raw bytes for every wrestler page, read once per run.
+    The Hall of Fame (billed heights) and the infobox pass both look at these
+    pages; one directory listing and one read each beats a stat and an open
+    per lookup. Empty if the directory is missing."""
+    pages = {}
+    try:
+        with os.scandir(WRESTLERS_DIR) as it:
+            for entry in it:
+                if entry.name.endswith('.html') and entry.is_file():
+                    with open(entry.path, 'rb') as f:
+                        pages[entry.name] = f.read()
+    except FileNotFoundError:
+        pass
+    return pages
+
+
+# Bytes pattern so it runs straight over the raw page.
+_BILLED_HEIGHT_RE = re.compile(rb'<th>Billed height</th>\s*<td>(.*?)</td>', re.DOTALL)
+
+
+def read_infobox_height(name, pages):
+    m = _BILLED_HEIGHT_RE.search(pages.get(f'{_page_name(name)}.html', b''))
+    return m.group(1).decode('utf-8').strip() if m else ''
+
+
+def compute_hof_classes(db, peaks, held_titles, careers):
+    years = [d.year for d in (_parse_date(e.get('date')) for e in db.events) if d]
     if not years:
         return {}
+    first_year, last_year = min(years), max(years)
+    # Everything except retirement is fixed for the whole run, so filter the
+    # roster once up front and leave only the year check inside the loop.
+    major_champions = {name for name, held in held_titles.items()
+                       if any(org in MAJOR_ORGS for org, _ in held)}
+    # Peak Elo doesn't move between classes, so walk the roster in induction
+    # order (best peak first) once: everyone after the first peak under the bar
+    # is under it too, and each year then takes the first few who are retired.
+    by_peak = sorted(((peaks.get(name, BASE_RATING), name) for name in db.ppv_wrestlers
+                      if name in db.wrestlers),
+                     key=lambda c: (-c[0], c[1]))
+    candidates = []
+    for peak, name in by_peak:
+        if peak < HOF_MIN_PEAK_ELO:
+            break
+        w = db.wrestlers[name]
+        total = w['wins'] + w['losses'] + w['draws']
+        if total == 0:
+            continue
+        if w['wins'] < HOF_MIN_WINS:
+            continue
+        if w['wins'] / total < HOF_MIN_WIN_PCT:
+            continue
+        if HOF_REQUIRE_MAJOR and name not in major_champions:
+            continue
+        # Retirement is the only test that moves with the class year, and it
+        # only ever turns on: note the first class each candidate can join.
+        candidates.append((name, careers[name][1] + HOF_RETIREMENT_YEARS))
+
     classes = {}
-    inducted = set()
-    for year in range(min(years) + HOF_RETIREMENT_YEARS + 1, max(years) + 1):
-        eligible = []
-        for name in sorted(db.wrestlers):
-            if name in inducted or name not in db.ppv_wrestlers:
-                continue
-            w = db.wrestlers[name]
-            total = w['wins'] + w['losses'] + w['draws']
-            if total == 0:
-                continue
-            if last_match_year(db, name) > year - HOF_RETIREMENT_YEARS:
-                continue
-            if w['wins'] < HOF_MIN_WINS:
-                continue
-            if w['wins'] / total < HOF_MIN_WIN_PCT:
-                continue
-            if HOF_REQUIRE_MAJOR and not any(
-                    reign['champion'] == name
-                    for org in MAJOR_ORGS
-                    for weight in WEIGHT_ORDER
-                    for reign in db.championships[org][weight]):
-                continue
-            if peaks[name] < HOF_MIN_PEAK_ELO:
-                continue
-            eligible.append((name, peaks[name]))
-        eligible.sort(key=lambda x: (-x[1], x[0]))
-        if eligible[:HOF_MAX_PER_YEAR]:
-            classes[year] = [n for n, _ in eligible[:HOF_MAX_PER_YEAR]]
-            inducted.update(classes[year])
+    for year in range(first_year + HOF_RETIREMENT_YEARS + 1, last_year + 1):
+        picks = []
+        for name, eligible in candidates:
+            if eligible <= year:
+                picks.append(name)
+                if len(picks) == HOF_MAX_PER_YEAR:
+                    break
+        if picks:
+            classes[year] = picks
+            # Inducted wrestlers leave the pool for good.
+            picked = set(picks)
+            candidates = [c for c in candidates if c[0] not in picked]
     return classes
 
 
-def generate_hof_html(db, peaks, peak_rank):
-    classes = compute_hof_classes(db, peaks)
+def generate_hof_html(db, peaks, peak_rank, pages):
+    held_titles = titles_by_champion(db)
+    careers = career_years(db)
+    classes = compute_hof_classes(db, peaks, held_titles, careers)
     lines = [
         '    <!-- List of PWHOF Members -->',
         '    <table class="hof-history">',
@@ -734,11 +846,10 @@ def generate_hof_html(db, peaks, peak_rank):
             if not w:
                 continue
             record  = f"{w['wins']}-{w['losses']}-{w['draws']}"
-            titles  = all_titles_str(db, name)
+            titles  = all_titles_str(held_titles.get(name, ()))
             ranking = peak_rank.get(name, '')
-            height  = read_infobox_height(name)
-            debut   = first_match_year(db, name)
-            retired = last_match_year(db, name)
+            height  = read_infobox_height(name, pages)
+            debut, retired = careers[name]
             lines += [
                 '    <tr>',
                 f'        <th>{row}</th>',
@@ -770,24 +881,12 @@ def elo_extras(db, top_n=10, min_bouts=3):
                  competitors (the marquee bouts), rated pre-match.
     """
     ratings = defaultdict(lambda: BASE_RATING)
-    div_counts = defaultdict(lambda: defaultdict(int))
-
-    def division_index(name):
-        counts = div_counts.get(name)
-        if not counts:
-            return None
-        return WEIGHT_INDEX[min(counts, key=lambda w: (-counts[w], WEIGHT_INDEX[w]))]
 
     upset = {}
     opp_sum, opp_n = defaultdict(float), defaultdict(int)
     rated = []
-    for _when, m in singles_matches(db):
+    for (_when, m), (idx_a, idx_b) in zip(singles_matches(db), match_divisions(db)):
         a, b = m['fighter1'], m['fighter2']
-        wc = (m.get('weight_class') or '').lower()
-        if wc in WEIGHT_INDEX:
-            div_counts[a][wc] += 1
-            div_counts[b][wc] += 1
-        idx_a, idx_b = division_index(a), division_index(b)
         ra, rb = ratings[a], ratings[b]
 
         opp_sum[a] += rb; opp_n[a] += 1
@@ -881,17 +980,33 @@ def generate_best_matches_html(rows, size=10):
 
 
 def _replace_between(path, start, end, html, what):
-    if not os.path.exists(path):
+    _replace_blocks(path, [(start, end, html, what)])
+
+
+def _replace_blocks(path, blocks):
+    """Splice each (start, end, html, what) block between its markers in path,
+    with one read and one write of the file however many blocks there are
+    (records.html takes five in a row)."""
+    try:
+        with open(path, encoding='utf-8') as f:
+            content = original = f.read()
+    except FileNotFoundError:
         print(f"  ⚠ {path} not found")
         return
-    content = open(path, encoding='utf-8').read()
-    if start not in content or end not in content:
-        print(f"  ⚠ Markers not found in {path}")
-        return
-    content = (content.split(start)[0] + start + '\n' + html
-               + end + content.split(end)[1])
-    open(path, 'w', encoding='utf-8').write(content)
-    print(f"✓ Updated {what} in {path}")
+    for start, end, html, what in blocks:
+        # Slice at the markers rather than splitting the whole page on each.
+        i = content.find(start)
+        j = content.find(end, i + len(start)) if i >= 0 else -1
+        if j < 0:
+            print(f"  ⚠ Markers not found in {path}")
+            continue
+        content = content[:i] + start + '\n' + html + content[j:]
+        print(f"✓ Updated {what} in {path}")
+    # Nothing moved (the usual case on a re-run): leave the file, and its
+    # mtime, alone.
+    if content != original:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
 
 
 # Rankings this script writes are month-form ("No. 1 (Dec 2019)"); the
@@ -915,9 +1030,21 @@ def current_rankings(snapshots, months):
     return out
 
 
-def update_infoboxes(db, peak_rank, current_rank):
-    wrestlers_dir = 'wrestling/wrestlers'
-    if not os.path.exists(wrestlers_dir):
+# Infobox rows update_infoboxes rewrites, compiled once for the whole page sweep.
+_INFOBOX_RECORD_RE      = re.compile(rb'<th>(?:Career )?Record</th>\s*<td>')
+_RECORD_VALUE_RE        = re.compile(r'<th>(?:Career )?Record</th>(\s*<td>)[^<]*(</td>)')
+_CAREER_RECORD_ROW_RE   = re.compile(r'(<th>Career Record</th>\s*<td>[^<]*</td>\s*</tr>)')
+_HIGHEST_VALUE_RE       = re.compile(r'(<th>Highest Ranking</th>\s*<td>)[^<]*(</td>)')
+_HIGHEST_ROW_RE         = re.compile(r'\s*<tr>\s*<th>Highest Ranking</th>.*?</tr>', re.DOTALL)
+_HIGHEST_ROW_START_RE   = re.compile(r'(\s*<tr>\s*<th>Highest Ranking</th>)')
+_RANKING_VALUE_RE       = re.compile(r'(<th>Ranking</th>\s*<td>)[^<]*(</td>)')
+_RANKING_ROW_RE         = re.compile(r'\s*<tr>\s*<th>Ranking</th>.*?</tr>', re.DOTALL)
+
+
+def update_infoboxes(db, peak_rank, current_rank, pages):
+    # pages is read_wrestler_pages(): empty only if there is no directory (or
+    # nothing in it), so no need to stat it again here.
+    if not pages:
         print("  ⚠ wrestling/wrestlers/ not found, skipping infobox update")
         return
 
@@ -926,26 +1053,27 @@ def update_infoboxes(db, peak_rank, current_rank):
         w = db.wrestlers.get(name)
         if not w:
             continue
-        filepath = f'{wrestlers_dir}/{_page_name(name)}.html'
-        if not os.path.exists(filepath):
+        filename = f'{_page_name(name)}.html'
+        raw = pages.get(filename)
+        if raw is None:
             continue
-        content = open(filepath, encoding='utf-8').read()
-        original = content
         # Only pages that carry an actual infobox are touched. Note that a bare
         # '<th>Record</th>' is not enough — every page's match table has a
         # "Record" column header — so require it to be an infobox row (a <th>
-        # immediately followed by its <td>).
-        if not re.search(r'<th>(?:Career )?Record</th>\s*<td>', content):
+        # immediately followed by its <td>). Checked on the raw bytes so pages
+        # without one are never decoded.
+        if not _INFOBOX_RECORD_RE.search(raw):
             continue
+        content = original = raw.decode('utf-8')
 
         record  = f"{w['wins']}-{w['losses']}-{w['draws']}"
         highest = peak_rank.get(name, '')
         current = current_rank.get(name, '')
 
-        content = re.sub(r'<th>Record</th>(\s*<td>)[^<]*(</td>)',
-                         r'<th>Career Record</th>\g<1>' + record + r'\g<2>', content)
-        content = re.sub(r'(<th>Career Record</th>\s*<td>)[^<]*(</td>)',
-                         r'\g<1>' + record + r'\g<2>', content)
+        # Old "Record" rows are renamed to "Career Record" in the same pass
+        # that writes the current figure into both kinds.
+        content = _RECORD_VALUE_RE.sub(
+            r'<th>Career Record</th>\g<1>' + record + r'\g<2>', content)
         content = content.replace('<th>Highest P4P Ranking</th>',
                                   '<th>Highest Ranking</th>')
 
@@ -957,18 +1085,15 @@ def update_infoboxes(db, peak_rank, current_rank):
         )
         if '<th>Highest Ranking</th>' in content:
             if highest:
-                content = re.sub(r'(<th>Highest Ranking</th>\s*<td>)[^<]*(</td>)',
-                                 r'\g<1>' + highest + r'\g<2>', content)
+                content = _HIGHEST_VALUE_RE.sub(r'\g<1>' + highest + r'\g<2>', content)
             elif _is_generated_ranking(content):
                 # Only clear rows this script wrote. Several pre-database
                 # legends (El Santo, Lou Thesz, ...) carry hand-authored
                 # year-form rankings from before the match data begins; if one
                 # of them ever picks up a match they must not be wiped.
-                content = re.sub(r'\s*<tr>\s*<th>Highest Ranking</th>.*?</tr>',
-                                 '', content, flags=re.DOTALL)
+                content = _HIGHEST_ROW_RE.sub('', content)
         elif highest:
-            content = re.sub(r'(<th>Career Record</th>\s*<td>[^<]*</td>\s*</tr>)',
-                             r'\g<1>' + ranking_row, content)
+            content = _CAREER_RECORD_ROW_RE.sub(r'\g<1>' + ranking_row, content)
 
         # Current ranking sits directly above Highest Ranking. '<th>Ranking</th>'
         # can't collide with '<th>Highest Ranking</th>' — the latter never
@@ -981,22 +1106,22 @@ def update_infoboxes(db, peak_rank, current_rank):
         )
         if '<th>Ranking</th>' in content:
             if current:
-                content = re.sub(r'(<th>Ranking</th>\s*<td>)[^<]*(</td>)',
-                                 r'\g<1>' + current + r'\g<2>', content)
+                content = _RANKING_VALUE_RE.sub(r'\g<1>' + current + r'\g<2>', content)
             else:
-                content = re.sub(r'\s*<tr>\s*<th>Ranking</th>.*?</tr>',
-                                 '', content, flags=re.DOTALL)
+                content = _RANKING_ROW_RE.sub('', content)
         elif current:
             if '<th>Highest Ranking</th>' in content:
-                content = re.sub(r'(\s*<tr>\s*<th>Highest Ranking</th>)',
-                                 current_row + r'\g<1>', content, count=1)
+                content = _HIGHEST_ROW_START_RE.sub(current_row + r'\g<1>',
+                                                    content, count=1)
             else:
-                content = re.sub(
-                    r'(<th>Career Record</th>\s*<td>[^<]*</td>\s*</tr>)',
-                    r'\g<1>' + current_row, content)
+                content = _CAREER_RECORD_ROW_RE.sub(r'\g<1>' + current_row, content)
 
         if content != original:
-            open(filepath, 'w', encoding='utf-8').write(content)
+            # Read as raw bytes, so written back untranslated (newline='') —
+            # a CRLF page must not come back with doubled '\r's.
+            with open(f'{WRESTLERS_DIR}/{filename}', 'w', encoding='utf-8',
+                      newline='') as f:
+                f.write(content)
             updated += 1
     print(f"✓ Infoboxes updated: {updated} file(s) changed")
 
@@ -1114,8 +1239,8 @@ def run(db):
     print(f"  {len(months)} month(s) archived: {months[0]} -> {months[-1]}")
 
     os.makedirs(P4P_DIR, exist_ok=True)
-    for key in months:
-        write_month_page(db, snapshots, months, key)
+    for i in range(len(months)):
+        write_month_page(db, snapshots, months, i)
     write_index_page(db, snapshots, months)
 
     # Drop month pages that are no longer published (a match date was corrected,
@@ -1133,42 +1258,65 @@ def run(db):
 
     peak_rank = peak_rankings(snapshots, months)
     peaks = peak_elo(db)
+    pages = read_wrestler_pages()
     _replace_between('wrestling/org/pwhof.html',
                      '<!-- HOFMEMBERS_START -->', '<!-- HOFMEMBERS_END -->',
-                     generate_hof_html(db, peaks, peak_rank), 'Hall of Fame')
+                     generate_hof_html(db, peaks, peak_rank, pages), 'Hall of Fame')
 
     weeks_rows, consec_rows = p4p_week_records(snapshots, months)
-    _replace_between('wrestling/records.html',
-                     '<!-- P4PWEEKS_START -->', '<!-- P4PWEEKS_END -->',
-                     generate_p4p_weeks_html(weeks_rows), 'Weeks-at-No.1 record')
-    _replace_between('wrestling/records.html',
-                     '<!-- P4PCONSEC_START -->', '<!-- P4PCONSEC_END -->',
-                     generate_p4p_consec_html(consec_rows), 'Consecutive-weeks-at-No.1 record')
-
     giant, opp_rows, best = elo_extras(db)
-    _replace_between('wrestling/records.html',
-                     '<!-- GIANTKILLER_START -->', '<!-- GIANTKILLER_END -->',
-                     generate_giant_killer_html(giant), 'Giant Killer record')
-    _replace_between('wrestling/records.html',
-                     '<!-- OPPRATING_START -->', '<!-- OPPRATING_END -->',
-                     generate_opp_rating_html(opp_rows), 'Opponent-rating record')
-    _replace_between('wrestling/records.html',
-                     '<!-- BESTMATCHES_START -->', '<!-- BESTMATCHES_END -->',
-                     generate_best_matches_html(best), 'Best-matches record')
-
-    update_infoboxes(db, peak_rank, current_rankings(snapshots, months))
-
+    _replace_blocks('wrestling/records.html', [
+        ('<!-- P4PWEEKS_START -->', '<!-- P4PWEEKS_END -->',
+         generate_p4p_weeks_html(weeks_rows), 'Weeks-at-No.1 record'),
+        ('<!-- P4PCONSEC_START -->', '<!-- P4PCONSEC_END -->',
+         generate_p4p_consec_html(consec_rows), 'Consecutive-weeks-at-No.1 record'),
+        ('<!-- GIANTKILLER_START -->', '<!-- GIANTKILLER_END -->',
+         generate_giant_killer_html(giant), 'Giant Killer record'),
+        ('<!-- OPPRATING_START -->', '<!-- OPPRATING_END -->',
+         generate_opp_rating_html(opp_rows), 'Opponent-rating record'),
+        ('<!-- BESTMATCHES_START -->', '<!-- BESTMATCHES_END -->',
+         generate_best_matches_html(best), 'Best-matches record'),
+    ])
+
+    update_infoboxes(db, peak_rank, current_rankings(snapshots, months), pages)
+
+
+# The parsed database, pickled together with the stat signature of everything
+# it was built from. Parsing the match lists is most of a standalone run, and
+# the Elo replay on top of it is cheap, so this is the one thing worth keeping.
+CACHE_PATH = 'wrestling/.elo-cache.pkl'
+
+
+def _source_signature(paths):
+    sig = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        sig.append((path, st.st_mtime_ns, st.st_size))
+    return tuple(sig)
+
+
+def load_database(ppv, weekly):
+    """(db, why) — the parsed, chronologically reprocessed database, read back
+    from CACHE_PATH when neither match list nor update.py has changed since it
+    was written."""
+    sig = _source_signature((ppv, weekly, os.path.join(SCRIPT_DIR, 'update.py')))
+    try:
+        with open(CACHE_PATH, 'rb') as f:
+            cached_sig, db, why = pickle.load(f)
+        if cached_sig == sig:
+            print("  Match lists unchanged; reusing the parsed database")
+            return db, why
+    except Exception:     # no cache yet, or written by an older layout
+        pass
 
-def main():
-    os.chdir(os.path.dirname(SCRIPT_DIR))
-    print(f"Working directory: {os.getcwd()}")
-    ppv, weekly = 'wrestling/ppv/list.html', 'wrestling/weekly/list.html'
     db = WrestlingDatabase()
     # Same site date update.py uses, so running this alone can't produce
     # rankings from a different timeline than the rest of the site.
     site_date, why = resolve_site_date(ppv, weekly)
     db.cutoff = site_date
-    print(f"Site date: {format_site_date(site_date) or '(none)'} — {why}")
     db.parse_events(ppv, is_weekly=False)
     if os.path.exists(weekly):
         db.parse_events(weekly, is_weekly=True)
@@ -1177,6 +1325,20 @@ def main():
     db.recalculate_bio_notes()
     db.process_vacancies()
     db.calculate_championship_days()
+    try:
+        with open(CACHE_PATH, 'wb') as f:
+            pickle.dump((sig, db, why), f, pickle.HIGHEST_PROTOCOL)
+    except OSError as e:
+        print(f"  ⚠ Could not write {CACHE_PATH}: {e}")
+    return db, why
+
+
+def main():
+    os.chdir(os.path.dirname(SCRIPT_DIR))
+    print(f"Working directory: {os.getcwd()}")
+    ppv, weekly = 'wrestling/ppv/list.html', 'wrestling/weekly/list.html'
+    db, why = load_database(ppv, weekly)
+    print(f"Site date: {format_site_date(db.cutoff) or '(none)'} — {why}")
     print(f"  Loaded {len(db.wrestlers)} wrestlers, {len(db.events)} events")
     run(db)
     print("\n✓ Elo ratings and P4P pages updated!")
@@ -10,6 +10,9 @@ Usage:
   source ~/wrestling-venv/bin/activate
   python3 wrestling/jobber.py
 
+Every prompt can also be answered up front (see USAGE below), which runs the
+whole thing without stopping — handy for scripted or repeated runs.
+
 Required packages (in wrestling-venv):
   pip install beautifulsoup4 faker
 """
@@ -18,9 +21,12 @@ from bs4 import BeautifulSoup
 from faker import Faker
 from datetime import datetime, timedelta
 from collections import defaultdict
+from functools import lru_cache
+import argparse
 import random
 import re
 import os
+import sys
 import calendar
 
 # ─── Faker locales ───────────────────────────────────────────────────────────
@@ -151,8 +157,10 @@ def normalise_date_str(date_str):
     return date_str
 
 
+@lru_cache(maxsize=None)
 def parse_date(date_str):
-    """Parse date string → datetime (supports full and abbreviated month names)."""
+    """Parse date string → datetime (supports full and abbreviated month names).
+    Memoized: the same card dates come back for every match on them."""
     normalised = normalise_date_str(date_str.strip())
     for fmt in ("%B %d, %Y", "%B %Y"):
         try:
@@ -172,6 +180,25 @@ def get_year_month(dt):
     return (dt.year, dt.month)
 
 
+# One run reads the same two list files for the wrestler menu, the country
+# lookup and the schedule check. Parse each once and hand every caller the same
+# tree; the key includes mtime and size so a file rewritten mid-run (the insert
+# step) is never served stale.
+_SOUP_CACHE = {}
+
+
+def load_soup(filepath):
+    """Parsed BeautifulSoup tree for `filepath`, shared across callers."""
+    st = os.stat(filepath)
+    key = (filepath, st.st_mtime_ns, st.st_size)
+    soup = _SOUP_CACHE.get(key)
+    if soup is None:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            soup = BeautifulSoup(f.read(), 'html.parser')
+        _SOUP_CACHE[key] = soup
+    return soup
+
+
 def parse_weekly_html(filepath):
     """Parse existing weekly list.html to extract all match dates per wrestler."""
     wrestler_dates = defaultdict(list)
@@ -180,10 +207,7 @@ def parse_weekly_html(filepath):
     if not os.path.exists(filepath):
         return wrestler_dates, all_event_dates
 
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    soup = BeautifulSoup(content, 'html.parser')
+    soup = load_soup(filepath)
     details_list = soup.find_all('details')
 
     for detail in details_list:
@@ -243,10 +267,7 @@ def parse_ppv_html(filepath):
     if not os.path.exists(filepath):
         return wrestler_dates
 
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    soup = BeautifulSoup(content, 'html.parser')
+    soup = load_soup(filepath)
     details_list = soup.find_all('details')
 
     for detail in details_list:
@@ -302,9 +323,7 @@ def get_wrestler_country(wrestler_name, weekly_path, ppv_path):
     for filepath in [ppv_path, weekly_path]:
         if not os.path.exists(filepath):
             continue
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-        soup = BeautifulSoup(content, 'html.parser')
+        soup = load_soup(filepath)
         for detail in soup.find_all('details'):
             table = detail.find('table', class_='match-card')
             if not table:
@@ -351,34 +370,33 @@ def get_titles_for_period(wrestler_name, start_dt, end_dt, weekly_path, ppv_path
     db.reprocess_championships_chronologically()
     db.process_vacancies()
 
+    # Only this wrestler's reigns (the db indexes them by champion), not every
+    # title history.
     titles = []
-    for org in ['wwf', 'wwo', 'iwb', 'ring']:
-        for weight in ['heavyweight', 'bridgerweight', 'middleweight', 'welterweight',
-                        'lightweight', 'featherweight']:
-            reigns = db.championships[org][weight]
-            for i, reign in enumerate(reigns):
-                if reign['champion'] != wrestler_name:
-                    continue
-                if 'vacancy_message' in reign:
-                    continue
+    for org, weight, i in db.reigns_by_champion().get(wrestler_name, ()):
+        if titles and titles[-1] == {'org': org, 'weight': weight}:
+            continue                    # already counted this belt
+        reigns = db.championships[org][weight]
+        reign = reigns[i]
+        if 'vacancy_message' in reign:
+            continue
 
-                reign_start = db.parse_date(reign['date'])
-                if not reign_start:
-                    continue
+        reign_start = db.parse_date(reign['date'])
+        if not reign_start:
+            continue
 
-                if i + 1 < len(reigns):
-                    next_start = db.parse_date(reigns[i + 1]['date'])
-                    reign_end = next_start if next_start else None
-                else:
-                    reign_end = None
+        if i + 1 < len(reigns):
+            next_start = db.parse_date(reigns[i + 1]['date'])
+            reign_end = next_start if next_start else None
+        else:
+            reign_end = None
 
-                if reign_end and reign_end < start_dt:
-                    continue
-                if reign_start > end_dt:
-                    continue
+        if reign_end and reign_end < start_dt:
+            continue
+        if reign_start > end_dt:
+            continue
 
-                titles.append({'org': org, 'weight': weight})
-                break
+        titles.append({'org': org, 'weight': weight})
 
     return titles
 
@@ -388,46 +406,29 @@ def generate_match_dates(start_dt, end_dt, count, occupied_months):
     Generate `count` random dates between start_dt and end_dt, respecting
     the 1-match-per-calendar-month constraint.
     """
-    available_slots = {}
-
-    current = start_dt.replace(day=1)
-    end_ym = (end_dt.year, end_dt.month)
-
-    while (current.year, current.month) <= end_ym:
-        ym = (current.year, current.month)
-        existing = occupied_months.get(ym, 0)
-        available = 1 - existing
-        if available > 0:
-            available_slots[ym] = available
-        if current.month == 12:
-            current = current.replace(year=current.year + 1, month=1)
-        else:
-            current = current.replace(month=current.month + 1)
-
-    total_available = sum(available_slots.values())
+    # Months as a single running index (year * 12 + month - 1), so the range
+    # is a plain integer range and "already booked" is a set lookup.
+    first = start_dt.year * 12 + start_dt.month - 1
+    last = end_dt.year * 12 + end_dt.month - 1
+    taken = {y * 12 + m - 1 for (y, m), n in occupied_months.items() if n > 0}
+    available_months = [(i // 12, i % 12 + 1)
+                        for i in range(first, last + 1) if i not in taken]
+
+    total_available = len(available_months)
     if total_available < count:
         return None, total_available
 
-    months_list = sorted(available_slots.keys())
     selected_dates = []
 
-    available_months = [ym for ym in months_list if available_slots.get(ym, 0) > 0]
-
-    if count <= len(available_months):
-        segment_size = len(available_months) / count
-        chosen_months = []
-        for i in range(count):
-            seg_start = int(i * segment_size)
-            seg_end = int((i + 1) * segment_size)
-            seg_end = max(seg_end, seg_start + 1)
-            picked = random.choice(available_months[seg_start:seg_end])
-            chosen_months.append(picked)
-    else:
-        chosen_months = list(available_months)
-        remaining = count - len(chosen_months)
-        extras = [ym for ym in available_months if available_slots[ym] > 1]
-        random.shuffle(extras)
-        chosen_months.extend(extras[:remaining])
+    # One pick from each of `count` equal segments spreads the matches out.
+    segment_size = len(available_months) / count
+    chosen_months = []
+    for i in range(count):
+        seg_start = int(i * segment_size)
+        seg_end = int((i + 1) * segment_size)
+        seg_end = max(seg_end, seg_start + 1)
+        picked = random.choice(available_months[seg_start:seg_end])
+        chosen_months.append(picked)
 
     for ym in chosen_months:
         year, month = ym
@@ -713,9 +714,7 @@ def get_all_wrestler_names(weekly_path, ppv_path):
     for filepath in [ppv_path, weekly_path]:
         if not os.path.exists(filepath):
             continue
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-        soup = BeautifulSoup(content, 'html.parser')
+        soup = load_soup(filepath)
         for detail in soup.find_all('details'):
             table = detail.find('table', class_='match-card')
             if not table:
@@ -759,12 +758,139 @@ def build_method_and_falls(resolved_result, is_defense):
     return method, falls
 
 
+# ─── Batch mode ─────────────────────────────────────────────────────────────
+
+USAGE = """
+  python3 wrestling/jobber.py                     interactive (prompts for everything)
+  python3 wrestling/jobber.py --wrestler NAME --start DATE --end DATE --count N
+                              [--gender m|f] [--result win|loss|draw|mix]
+                              [--weight N|NAME] [--defense] [--orgs wwf,iwb,...]
+                              [--locations mx|jp|us|mix] [--yes]"""
+
+EPILOG = """With the four required flags every prompt is answered from the command line;
+anything left out takes the prompt's default. --defense books title defenses,
+--orgs picks the belts when the wrestler held none in the range, and --yes
+skips the final confirmation.
+"""
+
+_RESULT_KEYS = {'win': 'w', 'loss': 'l', 'draw': 'd', 'mix': 'm'}
+_LOCATION_KEYS = {'mx': '1', 'jp': '2', 'us': '3', 'mix': '4'}
+_ORG_KEYS = ['wwf', 'wwo', 'iwb', 'ring']
+
+
+def _weight_arg(value):
+    """--weight as the prompt's menu number: accepts 1-6 or a class name."""
+    names = [w.lower() for w in WEIGHT_CLASSES]
+    if value.isdigit() and 1 <= int(value) <= len(names):
+        return value
+    if value.lower() in names:
+        return str(names.index(value.lower()) + 1)
+    raise argparse.ArgumentTypeError(
+        f"invalid choice: '{value}' (choose 1-{len(names)} or one of "
+        f"{', '.join(names)})")
+
+
+def _orgs_arg(value):
+    """--orgs as the prompt's comma-separated menu numbers; every entry must
+    be a known org."""
+    orgs = [o.strip().lower() for o in value.split(',')]
+    bad = [o for o in orgs if o not in _ORG_KEYS]
+    if bad:
+        raise argparse.ArgumentTypeError(
+            f"unknown org(s): {', '.join(bad)} (choose from {', '.join(_ORG_KEYS)})")
+    return ','.join(str(_ORG_KEYS.index(o) + 1) for o in orgs)
+
+
+def build_arg_parser():
+    parser = argparse.ArgumentParser(
+        prog='jobber.py', usage=USAGE, epilog=EPILOG,
+        description='Filler matches against generated jobbers.',
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--wrestler')
+    parser.add_argument('--start')
+    parser.add_argument('--end')
+    parser.add_argument('--count')
+    parser.add_argument('--gender', type=str.lower, choices=['m', 'f'])
+    parser.add_argument('--result', type=str.lower, choices=list(_RESULT_KEYS))
+    parser.add_argument('--weight', type=_weight_arg)
+    parser.add_argument('--defense', action='store_true')
+    parser.add_argument('--orgs', type=_orgs_arg)
+    parser.add_argument('--locations', type=str.lower, choices=list(_LOCATION_KEYS))
+    parser.add_argument('--yes', action='store_true')
+    return parser
+
+
+def parse_batch_args(args):
+    """Prompt answers from the command line, keyed by prompt — or None when
+    there are no arguments and the run should stay interactive. Bad values
+    and unknown flags stop the run with the usage text rather than falling
+    back to a default nobody asked for."""
+    parser = build_arg_parser()
+    opts = parser.parse_args(args)
+    if not args:
+        return None
+    missing = [f'--{f}' for f in ('wrestler', 'start', 'end', 'count')
+               if getattr(opts, f) is None]
+    if missing:
+        parser.error(f"batch mode needs {', '.join(missing)}")
+
+    answers = {
+        'wrestler':  opts.wrestler,
+        'gender':    opts.gender or '',
+        'result':    _RESULT_KEYS[opts.result] if opts.result else '',
+        'weight':    opts.weight or '',
+        'start':     opts.start,
+        'end':       opts.end,
+        'defense':   'y' if opts.defense else 'n',
+        'division':  '',
+        'orgs':      opts.orgs or '',
+        'count':     opts.count,
+        'locations': _LOCATION_KEYS[opts.locations] if opts.locations else '',
+    }
+    if opts.yes:
+        answers['retry'] = answers['confirm'] = 'y'
+    return answers
+
+
+def ask(answers, key, prompt):
+    """The scripted answer for `key` in batch mode, otherwise prompt for it.
+    Keys missing from `answers` (the confirmations without --yes) still
+    prompt, so a batch run can't write anything the user never saw — or,
+    with no terminal to prompt on, end the run without writing."""
+    if answers is not None and key in answers:
+        return answers[key]
+    if answers is not None and not sys.stdin.isatty():
+        # Scripted with nobody at the keyboard (cron, CI): stop cleanly instead
+        # of dying in input(). The plan above stands as a dry run.
+        print(prompt.strip())
+        print("  No terminal to answer on and --yes not given — nothing was written.")
+        sys.exit(0 if key == 'confirm' else 1)
+    return input(prompt).strip()
+
+
+def select_wrestler_batch(all_names, query):
+    """Exact name (case-insensitive) or a unique partial match, else None."""
+    exact = [n for n in all_names if n.lower() == query.lower()]
+    if exact:
+        return exact[0]
+    matches = [n for n in all_names if query.lower() in n.lower()]
+    if len(matches) == 1:
+        return matches[0]
+    if matches:
+        print(f"  ERROR: '{query}' matches {len(matches)} wrestlers: {', '.join(matches)}")
+    else:
+        print(f"  ERROR: No wrestler matches '{query}'.")
+    return None
+
+
 # ─── Main Interactive Flow ──────────────────────────────────────────────────
 
 def main():
     weekly_path = 'wrestling/weekly/list.html'
     ppv_path = 'wrestling/ppv/list.html'
 
+    answers = parse_batch_args(sys.argv[1:])
+
     print("=" * 60)
     print("  WRESTLING JOBBER MATCH GENERATOR")
     print("=" * 60)
@@ -773,7 +899,13 @@ def main():
     all_names = get_all_wrestler_names(weekly_path, ppv_path)
     print(f"\nFound {len(all_names)} wrestlers. Type to search:\n")
 
-    while True:
+    if answers is not None:
+        wrestler_name = select_wrestler_batch(all_names, answers['wrestler'])
+        if not wrestler_name:
+            return
+        print(f"  → Selected: {wrestler_name}")
+
+    while answers is None:
         query = input("Wrestler name (or partial): ").strip()
         if not query:
             continue
@@ -798,7 +930,7 @@ def main():
     print(f"  Country: {wrestler_country}")
 
     # 2. Jobber gender
-    gender_input = input("  Jobber gender — (m)ale or (f)emale? [m]: ").strip().lower()
+    gender_input = ask(answers, 'gender', "  Jobber gender — (m)ale or (f)emale? [m]: ").lower()
     jobber_gender = 'f' if gender_input == 'f' else 'm'
     print(f"  → {'Female' if jobber_gender == 'f' else 'Male'} jobbers")
 
@@ -809,7 +941,7 @@ def main():
     print("    l = losses only")
     print("    d = draws only")
     print("    m = mix (random wins, losses, and draws)")
-    result_input = input("  Pick [w/l/d/m, default w]: ").strip().lower()
+    result_input = ask(answers, 'result', "  Pick [w/l/d/m, default w]: ").lower()
     if result_input == 'l':
         result_type = 'loss'
         result_label = 'losses'
@@ -828,7 +960,7 @@ def main():
     print("\n  Weight class options:")
     for i, w in enumerate(WEIGHT_CLASSES, 1):
         print(f"    {i}. {w}")
-    wc_input = input("  Pick number [2=Bridgerweight]: ").strip()
+    wc_input = ask(answers, 'weight', "  Pick number [2=Bridgerweight]: ")
     if wc_input.isdigit() and 1 <= int(wc_input) <= len(WEIGHT_CLASSES):
         weight_class = WEIGHT_CLASSES[int(wc_input) - 1]
     else:
@@ -839,13 +971,13 @@ def main():
     print()
     print("  Date format: full or abbreviated month accepted")
     print("  e.g.  February 1970 / Feb 1970 / Feb 1, 1970 / February 1, 1970")
-    start_str = input("  Start date: ").strip()
+    start_str = ask(answers, 'start', "  Start date: ")
     start_dt = parse_date(start_str)
     if not start_dt:
         print("  ERROR: Could not parse start date.")
         return
 
-    end_str = input("  End date: ").strip()
+    end_str = ask(answers, 'end', "  End date: ")
     end_dt = parse_date(end_str)
     if not end_dt:
         print("  ERROR: Could not parse end date.")
@@ -879,7 +1011,7 @@ def main():
                 org_display = 'The Ring' if t['org'] == 'ring' else t['org'].upper()
                 print(f"    {i}. {org_display} {t['weight'].capitalize()}")
 
-            defense_input = input("\n  Generate wins as title defenses? (y/n): ").strip().lower()
+            defense_input = ask(answers, 'defense', "\n  Generate wins as title defenses? (y/n): ").lower()
             if defense_input == 'y':
                 is_defense = True
                 weights_held = defaultdict(list)
@@ -897,7 +1029,19 @@ def main():
                     for i, w in enumerate(weight_list, 1):
                         orgs = [('The Ring' if t['org'] == 'ring' else t['org'].upper()) for t in weights_held[w]]
                         print(f"    {i}. {w.capitalize()} ({', '.join(orgs)})")
-                    wc = input("  Pick number: ").strip()
+                    # Batch runs pick the division named by --weight, and
+                    # stop rather than guess when it doesn't name one of them
+                    # (weight_class would only be the prompt's default).
+                    if answers is not None:
+                        held = ', '.join(w.capitalize() for w in weight_list)
+                        if not answers['weight']:
+                            sys.exit(f"  ERROR: --defense: titles held in several divisions "
+                                     f"({held}); pass --weight to pick one.")
+                        if weight_class.lower() not in weight_list:
+                            sys.exit(f"  ERROR: --defense: no {weight_class} title held in "
+                                     f"this period (held: {held}).")
+                        answers['division'] = str(weight_list.index(weight_class.lower()) + 1)
+                    wc = ask(answers, 'division', "  Pick number: ")
                     if wc.isdigit() and 1 <= int(wc) <= len(weight_list):
                         defense_weight = weight_list[int(wc) - 1]
                         defense_orgs = [t['org'] for t in weights_held[defense_weight]]
@@ -908,7 +1052,7 @@ def main():
                         is_defense = False
         else:
             print(f"\n  {wrestler_name} did not hold any titles in this period.")
-            force = input("  Force title defense mode anyway? (y/n): ").strip().lower()
+            force = ask(answers, 'defense', "  Force title defense mode anyway? (y/n): ").lower()
             if force == 'y':
                 is_defense = True
                 print("\n  Select org(s) for defenses:")
@@ -916,13 +1060,16 @@ def main():
                 org_labels = ['WWF', 'WWO', 'IWB', 'The Ring']
                 for i, label in enumerate(org_labels, 1):
                     print(f"    {i}. {label}")
-                org_input = input("  Pick number(s), comma-separated (e.g. 1,3): ").strip()
+                org_input = ask(answers, 'orgs', "  Pick number(s), comma-separated (e.g. 1,3): ")
                 defense_orgs = []
                 for part in org_input.split(','):
                     part = part.strip()
                     if part.isdigit() and 1 <= int(part) <= 4:
                         defense_orgs.append(all_orgs[int(part) - 1])
                 if not defense_orgs:
+                    if answers is not None:
+                        sys.exit("  ERROR: --defense: no titles held in this period; "
+                                 "pass --orgs to pick the belts.")
                     print("  No valid orgs selected. Generating non-title matches.")
                     is_defense = False
                 else:
@@ -931,7 +1078,7 @@ def main():
                     print(f"  → Defending: {', '.join(chosen)} {weight_class}")
 
     # 7. Count
-    count_str = input("  Number of matches to generate: ").strip()
+    count_str = ask(answers, 'count', "  Number of matches to generate: ")
     if not count_str.isdigit() or int(count_str) < 1:
         print("  ERROR: Must be a positive integer.")
         return
@@ -954,7 +1101,7 @@ def main():
               f"slots available in {format_date(start_dt)} – {format_date(end_dt)}.")
         print(f"     (Wrestlers can fight at most 1× per calendar month.)")
         if max_available > 0:
-            retry = input(f"     Generate {max_available} instead? (y/n): ").strip().lower()
+            retry = ask(answers, 'retry', f"     Generate {max_available} instead? (y/n): ").lower()
             if retry == 'y':
                 count = max_available
                 match_dates, _ = generate_match_dates(start_dt, end_dt, count, occupied_months)
@@ -971,7 +1118,7 @@ def main():
     print("    2. Japan")
     print("    3. USA")
     print("    4. Mix (random)")
-    loc_input = input("  Pick number [4=Mix]: ").strip()
+    loc_input = ask(answers, 'locations', "  Pick number [4=Mix]: ")
     if loc_input == '1':
         nationalities = ['mx']
         print("  → Mexico only")
@@ -1048,7 +1195,7 @@ def main():
               f"({m['method']}, {m['falls']})")
 
     # 12. Confirm
-    confirm = input("\n  Insert into weekly/list.html? (y/n): ").strip().lower()
+    confirm = ask(answers, 'confirm', "\n  Insert into weekly/list.html? (y/n): ").lower()
     if confirm != 'y':
         print("  Cancelled.")
         return
@@ -71,6 +71,7 @@ How populate uses that:
 Nothing in .old/ is ever touched.
 """
 
+import pickle
 import re
 import sys
 import os
@@ -83,6 +84,9 @@ except ImportError:
 
 HERE = os.path.dirname(os.path.abspath(__file__))
 DEFAULT_LIST = os.path.join(HERE, "ppv", "list.html")
+# Parsed Open match cards from the last populate, keyed on the list's stat
+# signature (see cached_matches_by_year).
+CACHE_PATH = os.path.join(HERE, ".open-cache.pkl")
 
 # ---------------------------------------------------------------------------
 # Bracket geometry
@@ -130,8 +134,15 @@ SF_PAIRINGS = [
 FINAL_SLOTS = (6, 7)
 
 
+# Used per cell / per name across every bracket and card, so compiled once.
+WS_RE = re.compile(r"\s+")
+TAG_RE = re.compile(r"<[^>]+>")
+FLAG_RE = re.compile(r'fi-([a-z]{2,3})\b')
+WTS_NUM_RE = re.compile(r"World Title Series\s+(\d+)")
+
+
 def norm(name):
-    return re.sub(r"\s+", " ", (name or "")).strip()
+    return WS_RE.sub(" ", (name or "")).strip()
 
 
 # ---------------------------------------------------------------------------
@@ -188,7 +199,7 @@ def detect_bracket_gender(bracket_html, matches):
     teams = team_cells(bracket_html)
     if len(teams) != 14:
         return None
-    seeds = {norm(re.sub(r"<[^>]+>", "", teams[i].group(2)))
+    seeds = {norm(TAG_RE.sub("", teams[i].group(2)))
              for i in TEAMIDX_TO_SEED}
     for m in matches:
         if norm(m["f1"]) in seeds and norm(m["f2"]) in seeds:
@@ -233,9 +244,9 @@ def score_cells(bracket_html):
 
 def cell_flag_name(inner):
     """Split a team cell's inner HTML into (flag, name)."""
-    m = re.search(r'fi-([a-z]{2,3})\b', inner)
+    m = FLAG_RE.search(inner)
     flag = m.group(1) if m else "xx"
-    name = norm(re.sub(r"<[^>]+>", "", inner))
+    name = norm(TAG_RE.sub("", inner))
     return flag, name
 
 
@@ -380,6 +391,32 @@ def collect_matches_by_year(raw):
     return by_year
 
 
+def cached_matches_by_year(path, raw):
+    """collect_matches_by_year(raw), reused from CACHE_PATH while neither the
+    list at `path` nor this script has changed since. update.py populates on
+    every run, and the full-page parse is nearly all of that when there is
+    nothing new to fill in."""
+    sig = []
+    for p in (path, os.path.abspath(__file__)):
+        st = os.stat(p)
+        sig.append((os.path.abspath(p), st.st_mtime_ns, st.st_size))
+    sig = tuple(sig)
+    try:
+        with open(CACHE_PATH, "rb") as f:
+            cached_sig, by_year = pickle.load(f)
+        if cached_sig == sig:
+            return by_year
+    except Exception:     # no cache yet, or written by an older layout
+        pass
+    by_year = collect_matches_by_year(raw)
+    try:
+        with open(CACHE_PATH, "wb") as f:
+            pickle.dump((sig, by_year), f, pickle.HIGHEST_PROTOCOL)
+    except OSError as e:
+        print(f"  (Could not write {CACHE_PATH}: {e})")
+    return by_year
+
+
 # --- Match-card region helpers -------------------------------------------
 
 CARD_OPEN = '<table class="match-card">'
@@ -409,9 +446,9 @@ def row_fighters_and_notes(row_html):
     tds = TD_RE.findall(row_html)
     if len(tds) < 8:
         return None, None, ""
-    n1 = norm(re.sub(r"<[^>]+>", "", tds[2][1]))
-    n2 = norm(re.sub(r"<[^>]+>", "", tds[4][1]))
-    notes = norm(re.sub(r"<[^>]+>", "", tds[7][1])).lower()
+    n1 = norm(TAG_RE.sub("", tds[2][1]))
+    n2 = norm(TAG_RE.sub("", tds[4][1]))
+    notes = norm(TAG_RE.sub("", tds[7][1])).lower()
     return n1, n2, notes
 
 
@@ -481,7 +518,7 @@ def populate(path, only_year=None):
     with open(path, "r", encoding="utf-8") as f:
         raw = f.read()
 
-    matches_by_year = collect_matches_by_year(raw)
+    matches_by_year = cached_matches_by_year(path, raw)
     if not matches_by_year:
         print("No Open Tournament match cards found.")
         return
@@ -871,7 +908,7 @@ def wts_row(no, mtype="Singles", weight="Weight", note="",
 
 
 def next_wts_number(raw):
-    nums = [int(n) for n in re.findall(r"World Title Series\s+(\d+)", raw)]
+    nums = [int(n) for n in WTS_NUM_RE.findall(raw)]
     return (max(nums) + 1) if nums else 1
 
 
@@ -1049,7 +1086,7 @@ def _row_belt(note, weight):
     Stipulation bouts name a promotion without putting a belt on the line — the
     ladder match for a title-shot contract, and LibreMania's lucha de apuestas —
     so they are not calendar rows and must not be read as defences."""
-    text = re.sub(r'<[^>]+>', ' ', note).lower()
+    text = TAG_RE.sub(' ', note).lower()
     if 'contract' in text or 'apuesta' in text or weight.lower() == 'openweight':
         return None
     org = next((o for o in CAL_ORGS if o.lower() in text), None)
@@ -1298,7 +1335,7 @@ def maybe_generate_next_wts(path):
     empty, so this won't fire again until that card is completed too."""
     with open(path, "r", encoding="utf-8") as f:
         raw = f.read()
-    nums = [int(n) for n in re.findall(r"World Title Series\s+(\d+)", raw)]
+    nums = [int(n) for n in WTS_NUM_RE.findall(raw)]
     if not nums:
         return
     soup = BeautifulSoup(raw, "html.parser")
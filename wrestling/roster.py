@@ -36,6 +36,7 @@ import os
 import sys
 from collections import defaultdict
 from datetime import datetime
+from functools import lru_cache
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, SCRIPT_DIR)
@@ -84,6 +85,7 @@ def slugify(name):
     return name.lower().replace(' ', '-').replace('.', '')
 
 
+@lru_cache(maxsize=None)       # one parse per distinct date string
 def parse_date(s):
     for fmt in ("%B %d, %Y", "%B %Y", "%b %d, %Y", "%b %Y"):
         try:
@@ -26,16 +26,33 @@ Required packages:
 - beautifulsoup4 (for HTML parsing)
 - datetime, collections, os, re (built-in, no install needed)
 
+Optional:
+- lxml (pip install lxml) — faster parser for the match lists; used when
+  installed, otherwise the built-in html.parser does the same job. The two
+  build the same tree for well-formed cards, but they repair broken markup
+  differently — so after hand-editing a list, run once with lxml and once in
+  a venv without it, and check the generated pages come out the same.
+
 After running, check the changes and git push if everything looks good.
 """
 
 from bs4 import BeautifulSoup, Comment
+from bisect import bisect_left, bisect_right
 from datetime import datetime
 from collections import defaultdict
+from functools import lru_cache
+import importlib.util
 import os
 import re
+import sys
 import glob
 
+# The match lists are the biggest thing parsed on every run. lxml's C tokenizer
+# reads them faster and builds the same tree for them; without it, fall back
+# to the stdlib parser so beautifulsoup4 stays the only requirement. Only
+# whether it is installed matters here — bs4 does the importing.
+SOUP_PARSER = 'lxml' if importlib.util.find_spec('lxml') is not None else 'html.parser'
+
 # ============================================================================
 # WHERE THE SAVE IS UP TO
 # ============================================================================
@@ -65,17 +82,108 @@ import glob
 SAVE_MARKER = '<!-- NOW -->'
 
 
+# Every reign, defence and match carries its card's date string, and the stats
+# passes parse the same few hundred of them thousands of times over. datetimes
+# are immutable, so one parse per distinct string can be shared.
+@lru_cache(maxsize=None)
+def _parse_date(date_str):
+    for fmt in ("%B %d, %Y", "%B %Y", "%b %d, %Y", "%b %Y"):
+        try:
+            return datetime.strptime(date_str.strip(), fmt)
+        except (ValueError, AttributeError):
+            continue
+    return None
+
+
+# Every replay, records pass and stats walk asks this of the same few hundred
+# note strings, so the answer is worked out once per distinct note.
+@lru_cache(maxsize=None)
+def _title_orgs(notes):
+    notes_lower = notes.lower()
+    # The keyword test doesn't depend on the org, so it's made once, up front;
+    # 'title' and 'championship' also cover their plurals.
+    if 'title' not in notes_lower and 'championship' not in notes_lower:
+        return ()
+    return tuple(org for org in ('wwf', 'wwo', 'iwb', 'ring') if org in notes_lower)
+
+
+# Which belt a title bout was for: the first weight, heaviest down, named in
+# the notes or the match's weight class. Asked by the live pass, both
+# chronological replays and the bio notes of every title bout, over a small
+# set of distinct (notes, weight class) pairs.
+@lru_cache(maxsize=None)
+def _title_weight(notes, weight_class):
+    notes_lower = notes.lower()
+    class_lower = weight_class.lower()
+    for w in ('heavyweight', 'bridgerweight', 'middleweight',
+              'welterweight', 'lightweight', 'featherweight'):
+        if w in notes_lower or w in class_lower:
+            return w
+    return None
+
+
+# Bio notes come from a handful of org combinations per weight, written once
+# for every title bout in the live pass and again in the recalculation, so
+# each distinct (orgs, weight) line is only put together once.
+@lru_cache(maxsize=None)
+def _orgs_list(orgs):
+    # Apply italics to The Ring
+    formatted_orgs = ['<i>The Ring</i>' if org == 'The Ring' else org for org in orgs]
+
+    if len(formatted_orgs) == 1:
+        return formatted_orgs[0]
+    elif len(formatted_orgs) == 2:
+        return f"{formatted_orgs[0]} and {formatted_orgs[1]}"
+    else:
+        # 3 or more: "A, B, and C"
+        return ', '.join(formatted_orgs[:-1]) + f", and {formatted_orgs[-1]}"
+
+
+@lru_cache(maxsize=None)
+def _title_notes(retained_orgs, won_orgs, for_orgs, weight, lost_orgs):
+    bio_notes_parts = []
+
+    for verb, orgs in (("Retained", retained_orgs), ("Won", won_orgs),
+                       ("Lost", lost_orgs), ("For", for_orgs)):
+        if orgs:
+            title_word = "titles" if len(orgs) > 1 else "title"
+            bio_notes_parts.append(f"{verb} {_orgs_list(orgs)} {weight.capitalize()} {title_word}")
+
+    return '<br>'.join(bio_notes_parts)
+
+
+# 'WWF Heavyweight', '<i>The Ring</i> Lightweight', ... for every belt, built
+# once rather than per reign on every wrestler page.
+_TITLE_LABEL = {(org, weight): f"{'<i>The Ring</i>' if org == 'ring' else org.upper()} "
+                               f"{weight.capitalize()}"
+                for org in ['wwf', 'wwo', 'iwb', 'ring']
+                for weight in ['heavyweight', 'bridgerweight', 'middleweight',
+                               'welterweight', 'lightweight', 'featherweight']}
+
+
+# Every script reads each list twice — once in resolve_site_date()'s probe and
+# again for the real parse — so the cut text is kept per path, and only reused
+# while the file's size and mtime say it hasn't been touched since.
+_SOURCES = {}
+
+
 def read_source(path):
     """File contents cut off at SAVE_MARKER, plus whether it was found.
 
     Everything below the marker is discarded before the parser ever sees it,
     so a retro save can't be contaminated by events further down the file.
     """
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _SOURCES.get(path)
+    if cached and cached[0] == stamp:
+        return cached[1]
     with open(path, 'r', encoding='utf-8') as f:
         content = f.read()
-    if SAVE_MARKER in content:
-        return content.split(SAVE_MARKER)[0], True
-    return content, False
+    head, marker, _ = content.partition(SAVE_MARKER)
+    result = (head, bool(marker))
+    _SOURCES[path] = (stamp, result)
+    return result
 
 
 def resolve_site_date(ppv_path, weekly_path=None):
@@ -213,9 +321,13 @@ def abbreviate_dates_in_generated_files():
                   'wrestling/org/draft.html'])
     changed = 0
     for f in targets:
-        if not os.path.exists(f):
+        # Open straight away rather than stat first: the globbed pages all
+        # exist, and only the fixed few at the end might not.
+        try:
+            with open(f, encoding='utf-8') as fh:
+                content = fh.read()
+        except FileNotFoundError:
             continue
-        content = open(f, encoding='utf-8').read()
         new = abbr_dates_html(content)
         # Drop the gender label from Open Tournament notes (display only; the
         # source list keeps "Men's/Women's" so the parser can tell them apart).
@@ -227,6 +339,48 @@ def abbreviate_dates_in_generated_files():
     print(f"  Abbreviated dates in {changed} generated file(s).")
 
 
+def _splice(content, start, end, html):
+    """content with whatever sits between the start and end markers replaced
+    by html (markers kept). Sliced at the first of each rather than splitting
+    the whole page on both; unchanged if either marker is missing."""
+    i = content.find(start)
+    j = content.find(end, i + len(start)) if i >= 0 else -1
+    if j < 0:
+        return content
+    return content[:i] + start + '\n' + html + content[j:]
+
+
+# Patterns the parsing passes apply to every name, card, comment and wrestler
+# page, compiled once here rather than looked up in re's cache on each call.
+_CHAMP_MARK_RE    = re.compile(r'\s*\(c\)\s*', re.IGNORECASE)
+_VACATED_RE       = re.compile(r'VACATED TITLE:\s*([^.]+)', re.IGNORECASE)
+_VAC_CHAMPION_RE  = re.compile(r'Champion:\s*([^.]+)', re.IGNORECASE)
+_VAC_DATE_RE      = re.compile(r'Date:\s*([^.]+)', re.IGNORECASE)
+_VAC_MESSAGE_RE   = re.compile(r'Message:\s*(.*?)(?:\s*-->|$)', re.IGNORECASE | re.DOTALL)
+_WTS_NAME_RE      = re.compile(r'World Title Series (\d+)')
+_WCW_NAME_RE      = re.compile(r'World Championship Wrestling (\d+)')
+_OPEN_NAME_RE     = re.compile(r'(\d{4}) Open Tournament')
+_TRIOS_NAME_RE    = re.compile(r'(\d{4}) Trios Tournament')
+_NAME_SUFFIX_RE   = re.compile(r'\s*-\s*.+')
+_ELIM_PREFIX_RE   = re.compile(r'^.*?:\s*')
+_ELIM_RE          = re.compile(r'([^.]+?)\s+elim\.\s+([^.]+)')
+_APUESTAS_RE      = re.compile(r'lucha\s+de\s+apuestas\.?\s*(.+)', re.IGNORECASE)
+_FINISH_RE        = re.compile(r'pinfall|submission', re.IGNORECASE)
+_DQ_RE            = re.compile(r'dq|count ?out|disqualification', re.IGNORECASE)
+_PAGE_RECORD_RE   = re.compile(r'(<th>(?:Career )?Record</th>\s*<td>)[^<]*(</td>)')
+_PAGE_INFOBOX_RE  = re.compile(r'<div class="infobox".*?</table>', re.DOTALL)
+_TITLES_ROW_RE    = re.compile(r'\s*<tr>\s*<th>Titles</th>\s*<td>.*?</td>\s*</tr>', re.DOTALL)
+_TABLE_END_RE     = re.compile(r'\s*(?:</tbody>)?\s*</table>')
+
+
+# Titles only change hands on pinfall, submission, or decision (not DQ or
+# countout). The live pass, both replays and the bio notes all ask this of the
+# same few dozen method strings.
+@lru_cache(maxsize=None)
+def _title_can_change(method):
+    return bool(_FINISH_RE.search(method)) or not _DQ_RE.search(method)
+
+
 class WrestlingDatabase:
     def __init__(self):
         # Events dated after this are skipped at parse time. main() sets it
@@ -255,15 +409,15 @@ class WrestlingDatabase:
         self.tournaments = {'open': [], 'trios': []}
         self.vacancies = []
         self.apuestas = []  # Track Lucha de Apuestas matches
+        self._career_suffix = {}  # name -> career-span suffix (record tables)
+        self._reigns_by_champion = None  # see reigns_by_champion
+        self._matches_by_date = None     # see matches_by_date
+        self._reign_start_index = {}     # see _reign_starts
+        self._title_bouts = None   # see _title_bout_counts
 
     def parse_date(self, date_str):
         """Parse date from various formats (full or abbreviated month)."""
-        for fmt in ("%B %d, %Y", "%B %Y", "%b %d, %Y", "%b %Y"):
-            try:
-                return datetime.strptime(date_str.strip(), fmt)
-            except (ValueError, AttributeError):
-                continue
-        return None
+        return _parse_date(date_str)
 
     def days_between(self, date1_str, date2_str):
         """Calculate days between two dates"""
@@ -281,7 +435,11 @@ class WrestlingDatabase:
 
     def get_country(self, element):
         """Extract country code from flag span"""
-        flag = element.find('span', class_='fi')
+        return self._flag_country(element.find('span', class_='fi'))
+
+    @staticmethod
+    def _flag_country(flag):
+        """Country code of a flag span already found (None -> 'un')."""
         if flag:
             classes = flag.get('class', [])
             for c in classes:
@@ -292,8 +450,11 @@ class WrestlingDatabase:
     def clean_name(self, text):
         """Clean wrestler name (remove (c) champion markers)"""
         text = text.strip()
-        text = re.sub(r'\s*\(c\)\s*', '', text, flags=re.IGNORECASE)
-        return text.strip()
+        text = _CHAMP_MARK_RE.sub('', text)
+        # Names are the keys for nearly everything (wrestlers, reigns,
+        # opponents) and get compared constantly; interning makes every
+        # occurrence of a name the same string object.
+        return sys.intern(text.strip())
 
     def extract_fighters_from_cell(self, cell):
         """Extract one or more fighter names and countries from a cell.
@@ -315,8 +476,13 @@ class WrestlingDatabase:
 
     def get_wrestler(self, name):
         """Get or create wrestler"""
-        if name not in self.wrestlers:
-            self.wrestlers[name] = {
+        # Called for both fighters of every bout and nearly always a hit: one
+        # lookup on that path, not a membership test followed by a fetch.
+        # (A defaultdict would quietly create wrestlers on any stray read.)
+        try:
+            return self.wrestlers[name]
+        except KeyError:
+            w = self.wrestlers[name] = {
                 'name': name,
                 'country': 'un',
                 'matches': [],
@@ -340,62 +506,52 @@ class WrestlingDatabase:
                 'battle_royal_eliminations_made': 0,
                 'battle_royal_eliminations_received': 0
             }
-        return self.wrestlers[name]
+            return w
 
-    def parse_vacancy_comments(self, html_content):
-        """Parse VACATED comments from HTML"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+    def parse_vacancy_comments(self, soup):
+        """Parse VACATED comments from the parsed match list"""
         comments = soup.find_all(string=lambda text: isinstance(text, Comment))
 
         for comment in comments:
             comment_text = comment.strip()
 
-            if 'VACATED TITLE' not in comment_text.upper():
-                continue
-
-            vacancy = {}
-
             # --- Extract org + weight STRICTLY from header ---
-            header_match = re.search(r'VACATED TITLE:\s*([^.]+)', comment_text, re.IGNORECASE)
+            # The header search is case-insensitive itself, so it doubles as
+            # the "is this a vacancy comment" test without upper-casing every
+            # comment first.
+            header_match = _VACATED_RE.search(comment_text)
             if not header_match:
                 continue
 
+            vacancy = {}
+
             header_tokens = header_match.group(1).strip().lower().split()
             if len(header_tokens) < 2:
                 continue
 
-            org_map = {
-                'wwf': 'wwf',
-                'wwo': 'wwo',
-                'iwb': 'iwb',
-                'ring': 'ring'
-            }
-
             org_token = header_tokens[0]
             weight_token = header_tokens[1]
 
-            if org_token not in org_map:
+            if org_token not in ('wwf', 'wwo', 'iwb', 'ring'):
                 continue
 
-            vacancy['org'] = org_map[org_token]
-            vacancy['weight'] = weight_token
+            # Interned like the names clean_name() hands out, so the reprocess
+            # pass compares these against reign keys and champions by identity.
+            vacancy['org'] = sys.intern(org_token)
+            vacancy['weight'] = sys.intern(weight_token)
 
             # --- Extract champion ---
-            champion_match = re.search(r'Champion:\s*([^.]+)', comment_text, re.IGNORECASE)
+            champion_match = _VAC_CHAMPION_RE.search(comment_text)
             if champion_match:
-                vacancy['champion'] = champion_match.group(1).strip()
+                vacancy['champion'] = sys.intern(champion_match.group(1).strip())
 
             # --- Extract date ---
-            date_match = re.search(r'Date:\s*([^.]+)', comment_text, re.IGNORECASE)
+            date_match = _VAC_DATE_RE.search(comment_text)
             if date_match:
                 vacancy['date'] = date_match.group(1).strip()
 
             # --- Extract full message safely ---
-            message_match = re.search(
-                r'Message:\s*(.*?)(?:\s*-->|$)',
-                comment_text,
-                re.IGNORECASE | re.DOTALL
-            )
+            message_match = _VAC_MESSAGE_RE.search(comment_text)
             if message_match:
                 vacancy['message'] = message_match.group(1).strip()
 
@@ -408,11 +564,15 @@ class WrestlingDatabase:
         if truncated:
             self.truncated = True
 
-        # Parse vacancy comments first (only for PPV)
-        if not is_weekly:
-            self.parse_vacancy_comments(html_content)
-        
-        soup = BeautifulSoup(html_content, 'html.parser')
+        # One parse of the file serves both passes.
+        soup = BeautifulSoup(html_content, SOUP_PARSER)
+
+        # Parse vacancy comments first (only for PPV). A comment can only
+        # match if its header is somewhere in the raw text, and one C-level
+        # scan of that is far cheaper than visiting every string in the tree.
+        if not is_weekly and _VACATED_RE.search(html_content):
+            self.parse_vacancy_comments(soup)
+
         details = soup.find_all('details')
         
         for detail in details:
@@ -428,31 +588,31 @@ class WrestlingDatabase:
                 event_name = "Live TV"
             else:
                 event_name = event_name.split(':')[0].strip()
-                event_name = re.sub(r'World Title Series (\d+)', r'WTS \1', event_name)
-                event_name = re.sub(r'World Championship Wrestling (\d+)', r'WCW \1', event_name)
-                event_name = re.sub(r'(\d{4}) Open Tournament', r'\1 Open', event_name)
-                event_name = re.sub(r'(\d{4}) Trios Tournament', r'\1 Trios', event_name)
+                event_name = _WTS_NAME_RE.sub(r'WTS \1', event_name)
+                event_name = _WCW_NAME_RE.sub(r'WCW \1', event_name)
+                event_name = _OPEN_NAME_RE.sub(r'\1 Open', event_name)
+                event_name = _TRIOS_NAME_RE.sub(r'\1 Trios', event_name)
                 # Remove everything after " - " (including Day X, The Finals, etc.)
-                event_name = re.sub(r'\s*-\s*.+', '', event_name)
+                event_name = _NAME_SUFFIX_RE.sub('', event_name)
 
             if table:
-                self.parse_match_card(table, event_name, is_weekly=is_weekly)
-            
-            # Parse battle royal eliminations from <p> tags in this detail
-            # Extract event date from the table's last row for context
-            if table:
+                # The card's rows and its info-row cells are looked up once:
+                # the card parse and the battle-royal pass both read them.
                 rows = table.find('tbody').find_all('tr')
+                th_cells = rows[-1].find_all('th') if rows else []
+                self.parse_match_card(rows, th_cells, event_name, is_weekly=is_weekly)
+
+                # Parse battle royal eliminations from <p> tags in this detail
+                # Extract event date from the table's last row for context
                 if rows:
-                    info_row = rows[-1]
-                    th_cells = info_row.find_all('th')
                     ev_date = th_cells[-1].get_text().strip() if th_cells else None
                     self.parse_battle_royal_eliminations(detail, event_name, ev_date)
             
 
-    def parse_match_card(self, table, event_name, is_weekly=False):
-        """Parse individual match card — singles and multi-man matches"""
-        rows = table.find('tbody').find_all('tr')
-        info_row = rows[-1]
+    def parse_match_card(self, rows, th_cells, event_name, is_weekly=False):
+        """Parse individual match card — singles and multi-man matches.
+        rows are the card's <tbody> rows; th_cells the <th> cells of the last
+        (event info) row."""
         match_rows = rows[1:-1]
         
         # Extract event info from last row
@@ -464,7 +624,6 @@ class WrestlingDatabase:
         broadcast_type = None
         attendance = None
         network = ""
-        th_cells = info_row.find_all('th')
         
         if is_weekly:
             # Weekly shows format: <th>TV</th> <th colspan="2">Location</th> <th colspan="3">Venue</th> <th>Attendance</th> <th>Network</th> <th>Audience</th> <th>Date</th>
@@ -475,7 +634,7 @@ class WrestlingDatabase:
                     # Second th is location (with flag)
                     flag = th.find('span', class_='fi')
                     if flag:
-                        event_country = self.get_country(th)
+                        event_country = self._flag_country(flag)
                         event_location = text
                 elif idx == 2:
                     # Third th is venue
@@ -513,7 +672,7 @@ class WrestlingDatabase:
                     # Second th is location (with flag)
                     flag = th.find('span', class_='fi')
                     if flag:
-                        event_country = self.get_country(th)
+                        event_country = self._flag_country(flag)
                         event_location = text
                 elif idx == 2:
                     # Third th is venue
@@ -555,33 +714,37 @@ class WrestlingDatabase:
         }
 
         singles_match_idx = -1
+        last_idx = len(match_rows) - 1
         
         # Parse matches
         for idx, row in enumerate(match_rows):
-            cols = row.find_all(['td', 'th'])
+            # Cells are the row's direct children; no need for find_all to
+            # search inside every cell as well.
+            cols = [c for c in row.children if c.name in ('td', 'th')]
             if len(cols) < 7:
                 continue
 
+            # Skip matches that haven't happened yet: an empty Method means the
+            # bout is booked but unresolved, so it must not touch any records.
+            # Checked before any other cell's text is pulled out.
+            method = cols[6].get_text().strip()
+            if not method:
+                continue
+
             match_num = cols[0].get_text().strip()
             match_type = cols[1].get_text().strip()
             weight_class = cols[2].get_text().strip()
             fighter1_cell = cols[3]
             result_cell = cols[4]
             fighter2_cell = cols[5]
-            method = cols[6].get_text().strip()
             falls = cols[7].get_text().strip() if len(cols) > 7 else ''
             notes = cols[8].get_text().strip() if len(cols) > 8 else ''
 
-            # Skip matches that haven't happened yet: an empty Method means the
-            # bout is booked but unresolved, so it must not touch any records.
-            if not method:
-                continue
-
             # Handle non-singles matches
             # Match types: Tag, Trios, Three Way, Four Way, Battle Royal, Royal Rumble, Ladder, Gauntlet
             match_type_lower = match_type.lower()
             if match_type_lower != 'singles':
-                is_main_event = (idx == len(match_rows) - 1)
+                is_main_event = (idx == last_idx)
                 self.process_multi_man_match(
                     match_type=match_type,
                     weight_class=weight_class,
@@ -644,7 +807,7 @@ class WrestlingDatabase:
             event['matches'].append(match)
             
             # Check if this is the main event (last singles match)
-            is_main_event = (idx == len(match_rows) - 1)
+            is_main_event = (idx == last_idx)
             self.record_match(match, is_main_event, is_weekly=is_weekly)
 
         # A card that is booked but not yet wrestled (every Method blank) has no
@@ -696,66 +859,20 @@ class WrestlingDatabase:
         if not notes:
             return False, None
         
-        notes_lower = notes.lower()
-        orgs = ['wwf', 'wwo', 'iwb', 'ring']
-        title_keywords = ['title', 'titles', 'championship', 'championships']
-        
-        matched_orgs = []
-        for org in orgs:
-            if org in notes_lower:
-                for keyword in title_keywords:
-                    if keyword in notes_lower:
-                        matched_orgs.append(org)
-                        break
-
+        # A fresh list each time: callers are free to modify what they get.
+        matched_orgs = list(_title_orgs(notes))
         return (len(matched_orgs) > 0), matched_orgs
 
     def format_orgs_list(self, orgs):
         """Format list of orgs with proper grammar: 'WWF', 'WWF and WWO', 'WWF, WWO, and IWB'"""
         if not orgs:
             return ""
-        
-        # Apply italics to The Ring
-        formatted_orgs = []
-        for org in orgs:
-            if org == 'The Ring':
-                formatted_orgs.append('<i>The Ring</i>')
-            else:
-                formatted_orgs.append(org)
-        
-        if len(formatted_orgs) == 1:
-            return formatted_orgs[0]
-        elif len(formatted_orgs) == 2:
-            return f"{formatted_orgs[0]} and {formatted_orgs[1]}"
-        else:
-            # 3 or more: "A, B, and C"
-            return ', '.join(formatted_orgs[:-1]) + f", and {formatted_orgs[-1]}"
+        return _orgs_list(tuple(orgs))
     
     def format_title_notes(self, retained_orgs, won_orgs, for_orgs, weight, lost_orgs=None):
         """Format title notes with proper grammar"""
-        bio_notes_parts = []
-        
-        if retained_orgs:
-            formatted_orgs = self.format_orgs_list(retained_orgs)
-            title_word = "titles" if len(retained_orgs) > 1 else "title"
-            bio_notes_parts.append(f"Retained {formatted_orgs} {weight.capitalize()} {title_word}")
-        
-        if won_orgs:
-            formatted_orgs = self.format_orgs_list(won_orgs)
-            title_word = "titles" if len(won_orgs) > 1 else "title"
-            bio_notes_parts.append(f"Won {formatted_orgs} {weight.capitalize()} {title_word}")
-        
-        if lost_orgs:
-            formatted_orgs = self.format_orgs_list(lost_orgs)
-            title_word = "titles" if len(lost_orgs) > 1 else "title"
-            bio_notes_parts.append(f"Lost {formatted_orgs} {weight.capitalize()} {title_word}")
-        
-        if for_orgs:
-            formatted_orgs = self.format_orgs_list(for_orgs)
-            title_word = "titles" if len(for_orgs) > 1 else "title"
-            bio_notes_parts.append(f"For {formatted_orgs} {weight.capitalize()} {title_word}")
-        
-        return '<br>'.join(bio_notes_parts) if bio_notes_parts else ""
+        return _title_notes(tuple(retained_orgs or ()), tuple(won_orgs or ()),
+                            tuple(for_orgs or ()), weight, tuple(lost_orgs or ()))
 
     def process_multi_man_match(self, match_type, weight_class, fighter1_cell, result_cell,
                                  fighter2_cell, method, falls, notes, match_num, event_name,
@@ -859,11 +976,11 @@ class WrestlingDatabase:
             # Get the full text and extract eliminations
             full_text = p.get_text()
             # Remove the "Battle Royal:" prefix
-            elim_text = re.sub(r'^.*?:\s*', '', full_text, count=1)
+            elim_text = _ELIM_PREFIX_RE.sub('', full_text, count=1)
             
             # Parse "Name elim. Name." patterns
             # Split by periods, each segment is "Name elim. Name" or just "Name elim Name"
-            elim_pattern = re.findall(r'([^.]+?)\s+elim\.\s+([^.]+)', elim_text)
+            elim_pattern = _ELIM_RE.findall(elim_text)
             
             for eliminator_name, eliminated_name in elim_pattern:
                 eliminator_name = self.clean_name(eliminator_name.strip())
@@ -889,33 +1006,33 @@ class WrestlingDatabase:
         w1['country'] = match['fighter1_country']
         w2['country'] = match['fighter2_country']
 
+        # Lower-cased once up front; the checks below all read these
+        method_lower = match['method'].lower()
+        notes_lower = match['notes'].lower()
+
         if is_main_event and not is_weekly:  # Only count PPV main events
             w1['main_events'] += 1
             w2['main_events'] += 1
             
-            if 'wrestlemania' in match['event'].lower():
+            event_lower = match['event'].lower()
+            if 'wrestlemania' in event_lower:
                 w1['wrestlemania_main_events'] += 1
                 w2['wrestlemania_main_events'] += 1
-            elif 'libremania' in match['event'].lower():
+            elif 'libremania' in event_lower:
                 w1['libremania_main_events'] += 1
                 w2['libremania_main_events'] += 1
 
-        # Build enhanced notes for wrestler bio
+        # Build enhanced notes for wrestler bio. Drawn title bouts fill in
+        # per-fighter notes; everything else leaves these as None.
+        fighter1_notes = fighter2_notes = None
         is_title, orgs = self.is_title_match(match['notes'])
 
         if is_title and (match['winner'] or match['is_draw']):  # Include draws!
-            weights = ['heavyweight', 'bridgerweight', 'middleweight', 'welterweight', 'lightweight', 'featherweight']
-            notes_lower = match['notes'].lower()
-            weight = None
-            for w in weights:
-                if w in notes_lower or w in match['weight_class'].lower():
-                    weight = w
-                    break
-            
+            weight = _title_weight(match['notes'], match['weight_class'])
+
             if weight:
                 # Check if title can actually change (same logic as check_championship_change)
-                method_lower = match['method'].lower()
-                can_change_title = 'pinfall' in method_lower or 'submission' in method_lower or ('dq' not in method_lower and 'countout' not in method_lower and 'count out' not in method_lower and 'disqualification' not in method_lower)
+                can_change_title = _title_can_change(match['method'])
                 
                 # For draws, both fighters retain if they're champions
                 if match['is_draw']:
@@ -987,17 +1104,17 @@ class WrestlingDatabase:
             # For draws in title matches, each fighter gets their own notes
             if is_title and weight:
                 # Use the fighter-specific notes we built earlier
-                w1_notes = fighter1_notes if 'fighter1_notes' in locals() else bio_notes
-                w2_notes = fighter2_notes if 'fighter2_notes' in locals() else bio_notes
+                w1_notes = fighter1_notes if fighter1_notes is not None else bio_notes
+                w2_notes = fighter2_notes if fighter2_notes is not None else bio_notes
             else:
                 w1_notes = match['notes']
                 w2_notes = match['notes']
             
             w1['matches'].append({**match, 'result': 'Draw', 
-                                 'record': f"{w1['wins']}-{w1['losses']}-{w1['draws']}",
+                                 'record': (w1['wins'], w1['losses'], w1['draws']),
                                  'bio_notes': w1_notes})
             w2['matches'].append({**match, 'result': 'Draw', 
-                                 'record': f"{w2['wins']}-{w2['losses']}-{w2['draws']}",
+                                 'record': (w2['wins'], w2['losses'], w2['draws']),
                                  'bio_notes': w2_notes})
         elif match['winner']:
             winner = w1 if match['winner'] == match['fighter1'] else w2
@@ -1007,7 +1124,6 @@ class WrestlingDatabase:
             loser['losses'] += 1
 
             # Classify method: Pinfall, Submission, Draw, or Decision (anything else)
-            method_lower = match['method'].lower()
             if 'pinfall' in method_lower:
                 winner['pinfall_wins'] += 1
                 loser['pinfall_losses'] += 1
@@ -1020,13 +1136,13 @@ class WrestlingDatabase:
                 loser['decision_losses'] += 1
             
             # Check for Lucha de Apuestas in notes
-            if 'lucha de apuestas' in match['notes'].lower() or 'apuesta' in match['notes'].lower():
+            if 'lucha de apuestas' in notes_lower or 'apuesta' in notes_lower:
                 winner['lucha_wins'] += 1
                 
                 # Extract wager text - everything after "Lucha de Apuestas" (remove the period and leading/trailing spaces)
                 wager_text = ''
                 # Match "Lucha de Apuestas" followed by optional period and then capture the rest
-                wager_match = re.search(r'lucha\s+de\s+apuestas\.?\s*(.+)', match['notes'], re.IGNORECASE)
+                wager_match = _APUESTAS_RE.search(match['notes'])
                 if wager_match:
                     wager_text = wager_match.group(1).strip()
                 
@@ -1049,10 +1165,10 @@ class WrestlingDatabase:
                 loser_bio_notes = bio_notes
 
             winner['matches'].append({**match, 'result': 'Win', 
-                                    'record': f"{winner['wins']}-{winner['losses']}-{winner['draws']}",
+                                    'record': (winner['wins'], winner['losses'], winner['draws']),
                                     'bio_notes': bio_notes})
             loser['matches'].append({**match, 'result': 'Loss', 
-                                    'record': f"{loser['wins']}-{loser['losses']}-{loser['draws']}",
+                                    'record': (loser['wins'], loser['losses'], loser['draws']),
                                     'bio_notes': loser_bio_notes})
 
             # Check for championship
@@ -1064,24 +1180,19 @@ class WrestlingDatabase:
         if not is_title:
             return
 
-        weights = ['heavyweight', 'bridgerweight', 'middleweight', 'welterweight', 'lightweight', 'featherweight']
-        notes_lower = match['notes'].lower()
-        weight = None
-        for w in weights:
-            if w in notes_lower or w in match['weight_class'].lower():
-                weight = w
-                break
+        weight = _title_weight(match['notes'], match['weight_class'])
         if not weight:
             return
 
+        # Titles only change on pinfall, submission, or decision (not DQ/countout);
+        # the method is the same for every org on the line
+        can_change_title = _title_can_change(match['method'])
+
         for org in orgs:
             current_reigns = self.championships[org][weight]
             last_reign = current_reigns[-1] if current_reigns else None
 
             # Determine if this is a new reign
-            # Titles only change on pinfall, submission, or decision (not DQ/countout)
-            method_lower = match['method'].lower()
-            can_change_title = 'pinfall' in method_lower or 'submission' in method_lower or ('dq' not in method_lower and 'countout' not in method_lower and 'count out' not in method_lower and 'disqualification' not in method_lower)
 
             if match['winner'] and (not last_reign or last_reign['champion'] != match['winner']) and can_change_title:
                 # Start new reign
@@ -1090,12 +1201,10 @@ class WrestlingDatabase:
                 current_reigns[-1]['notes'] = f"Def. {match['fighter2'] if match['winner']==match['fighter1'] else match['fighter1']}"
             elif last_reign:
                 # Existing reign - check if champion retained (any result except pinfall/submission loss)
-                method_lower = match['method'].lower()
-                
                 # Determine if champion lost the title (pinfall or submission loss)
                 champion_lost = False
                 if match['winner'] and match['winner'] != last_reign['champion']:
-                    if 'pinfall' in method_lower or 'submission' in method_lower:
+                    if _FINISH_RE.search(match['method']):
                         champion_lost = True
                 
                 # If champion didn't lose, it's a successful defense
@@ -2022,6 +2131,8 @@ class WrestlingDatabase:
         for org in self.championships:
             for weight in self.championships[org]:
                 self.championships[org][weight] = []
+        self._reigns_by_champion = None
+        self._reign_start_index = {}
         
         # Find the most recent event date across ALL events (PPV and weekly)
         most_recent_date = None
@@ -2032,6 +2143,17 @@ class WrestlingDatabase:
                     if not most_recent_date or event_date > most_recent_date:
                         most_recent_date = event_date
         
+        # Vacancy dates per (org, weight, champion), parsed and sorted once
+        # instead of rescanning every vacancy for each title match.
+        vacated = defaultdict(list)
+        for vacancy in self.vacancies:
+            vac_date = self.parse_date(vacancy['date'])
+            if vac_date:
+                vacated[(vacancy['org'], vacancy['weight'],
+                         vacancy.get('champion'))].append(vac_date)
+        for dates in vacated.values():
+            dates.sort()
+
         # Go through all events in chronological order
         for event in self.events:
             for match in event['matches']:
@@ -2040,37 +2162,27 @@ class WrestlingDatabase:
                 if not is_title:
                     continue
                 
-                weights = ['heavyweight', 'bridgerweight', 'middleweight', 'welterweight', 'lightweight', 'featherweight']
-                notes_lower = match['notes'].lower()
-                weight = None
-                for w in weights:
-                    if w in notes_lower or w in match['weight_class'].lower():
-                        weight = w
-                        break
+                weight = _title_weight(match['notes'], match['weight_class'])
                 if not weight:
                     continue
                 
+                can_change_title = _title_can_change(match['method'])
+                
                 for org in orgs:
                     current_reigns = self.championships[org][weight]
                     last_reign = current_reigns[-1] if current_reigns else None
                     
-                    method_lower = match['method'].lower()
-                    can_change_title = 'pinfall' in method_lower or 'submission' in method_lower or ('dq' not in method_lower and 'countout' not in method_lower and 'count out' not in method_lower and 'disqualification' not in method_lower)
-                    
                     # Check if title was vacated between last reign and this match
                     was_vacated = False
                     if last_reign and last_reign['champion'] == match['winner']:
                         match_date_parsed = self.parse_date(match['date'])
                         last_reign_date_parsed = self.parse_date(last_reign['date'])
-                        for vacancy in self.vacancies:
-                            if (vacancy['org'] == org and 
-                                vacancy['weight'] == weight and
-                                vacancy.get('champion') == last_reign['champion']):
-                                vac_date = self.parse_date(vacancy['date'])
-                                if vac_date and last_reign_date_parsed and match_date_parsed:
-                                    if last_reign_date_parsed <= vac_date <= match_date_parsed:
-                                        was_vacated = True
-                                        break
+                        if last_reign_date_parsed and match_date_parsed:
+                            # First vacancy on/after the reign began, if any,
+                            # decides it: vacated if it came before this match.
+                            dates = vacated.get((org, weight, last_reign['champion']), ())
+                            i = bisect_left(dates, last_reign_date_parsed)
+                            was_vacated = i < len(dates) and dates[i] <= match_date_parsed
                     
                     if match['winner'] and (not last_reign or last_reign['champion'] != match['winner'] or was_vacated) and can_change_title:
                         # Update previous champion's days to the date they lost
@@ -2098,7 +2210,7 @@ class WrestlingDatabase:
                         # Existing reign - check if it's a defense
                         champion_lost = False
                         if match['winner'] and match['winner'] != last_reign['champion']:
-                            if 'pinfall' in method_lower or 'submission' in method_lower:
+                            if _FINISH_RE.search(match['method']):
                                 champion_lost = True
                         
                         if not champion_lost:
@@ -2144,31 +2256,52 @@ class WrestlingDatabase:
             return None
         
         reigns = self.championships[org][weight]
-        active_champ = None
-        for reign in reigns:
-            reign_start = self.parse_date(reign['date'])
-            if not reign_start:
+        # This title's vacancies, parsed once per lookup rather than once per
+        # earlier reign: champion -> [vacancy dates].
+        vacated = defaultdict(list)
+        for vacancy in self.vacancies:
+            if vacancy['org'] == org and vacancy['weight'] == weight:
+                vac_date = self.parse_date(vacancy['date'])
+                if vac_date:
+                    vacated[vacancy.get('champion')].append(vac_date)
+        # Reigns are in chronological order, so the one in force is the latest
+        # to start on or before the match: bisect to it and step back only past
+        # a reign this very match created.
+        starts, positions = self._reign_starts(org, weight)
+        k = bisect_right(starts, match_date_parsed)
+        while k > 0:
+            k -= 1
+            reign_start, reign = starts[k], reigns[positions[k]]
+            # Skip this reign if it's the one being CREATED by this match
+            if (reign_start == match_date_parsed and 
+                match_event and reign['event'] == match_event and
+                match_winner and reign['champion'] == match_winner):
                 continue
-            if reign_start <= match_date_parsed:
-                # Skip this reign if it's the one being CREATED by this match
-                if (reign_start == match_date_parsed and 
-                    match_event and reign['event'] == match_event and
-                    match_winner and reign['champion'] == match_winner):
-                    continue
-                active_champ = reign['champion']
-                # Check if this reign was vacated before the match date
-                for vacancy in self.vacancies:
-                    if (vacancy['org'] == org and
-                        vacancy['weight'] == weight and
-                        vacancy.get('champion') == active_champ):
-                        vac_date = self.parse_date(vacancy['date'])
-                        if vac_date and reign_start <= vac_date <= match_date_parsed:
-                            active_champ = None
-                            break
-            else:
-                break  # reigns are in chronological order, so stop once we pass match_date
-        
-        return active_champ
+            active_champ = reign['champion']
+            # Check if this reign was vacated before the match date
+            if any(reign_start <= vac_date <= match_date_parsed
+                   for vac_date in vacated.get(active_champ, ())):
+                return None
+            return active_champ
+        return None
+
+    def _reign_starts(self, org, weight):
+        """(start dates, positions) for one title's reigns: every parseable
+        start date in order, with each one's index into the reign list. Kept
+        per title while its history is unchanged, so looking up the champion
+        at a date is a bisect instead of a fresh parse of every reign."""
+        reigns = self.championships[org][weight]
+        cached = self._reign_start_index.get((org, weight))
+        if cached is None or cached[0] != len(reigns):
+            starts, positions = [], []
+            for i, reign in enumerate(reigns):
+                start = self.parse_date(reign['date'])
+                if start:
+                    starts.append(start)
+                    positions.append(i)
+            cached = (len(reigns), starts, positions)
+            self._reign_start_index[(org, weight)] = cached
+        return cached[1], cached[2]
 
     def recalculate_bio_notes(self):
         """Recalculate bio_notes for all matches after championship reprocessing.
@@ -2176,8 +2309,6 @@ class WrestlingDatabase:
         to determine who held each title at each point in time."""
         print("Recalculating bio notes in chronological order...")
         
-        weights = ['heavyweight', 'bridgerweight', 'middleweight', 'welterweight', 'lightweight', 'featherweight']
-        
         for event in self.events:
             for match in event['matches']:
                 is_title, orgs = self.is_title_match(match['notes'])
@@ -2185,17 +2316,11 @@ class WrestlingDatabase:
                 if not is_title or (not match['winner'] and not match['is_draw']):
                     continue
                 
-                notes_lower = match['notes'].lower()
-                weight = None
-                for w in weights:
-                    if w in notes_lower or w in match['weight_class'].lower():
-                        weight = w
-                        break
+                weight = _title_weight(match['notes'], match['weight_class'])
                 if not weight:
                     continue
                 
-                method_lower = match['method'].lower()
-                can_change_title = 'pinfall' in method_lower or 'submission' in method_lower or ('dq' not in method_lower and 'countout' not in method_lower and 'count out' not in method_lower and 'disqualification' not in method_lower)
+                can_change_title = _title_can_change(match['method'])
                 
                 if match['is_draw']:
                     # DRAW - each fighter retains if they're champ, otherwise "For"
@@ -2430,18 +2555,18 @@ class WrestlingDatabase:
         for t in entries_sorted:
             year_groups.setdefault(t['year'], []).append(t)
         
-        html = '    <table class="match-card">\n'
-        html += '        <thead>\n'
-        html += '            <tr>\n'
-        html += '                <th>No.</th>\n'
-        html += '                <th>Year</th>\n'
-        html += '                <th>Winner</th>\n'
-        html += '                <th>Runner-Up</th>\n'
-        html += '                <th>Venue</th>\n'
-        html += '                <th>Location</th>\n'
-        html += '            </tr>\n'
-        html += '        </thead>\n'
-        html += '        <tbody>\n'
+        parts = ['    <table class="match-card">\n']
+        parts.append('        <thead>\n')
+        parts.append('            <tr>\n')
+        parts.append('                <th>No.</th>\n')
+        parts.append('                <th>Year</th>\n')
+        parts.append('                <th>Winner</th>\n')
+        parts.append('                <th>Runner-Up</th>\n')
+        parts.append('                <th>Venue</th>\n')
+        parts.append('                <th>Location</th>\n')
+        parts.append('            </tr>\n')
+        parts.append('        </thead>\n')
+        parts.append('        <tbody>\n')
         
         # Number editions from total down to 1
         edition_num = len(year_groups)
@@ -2461,30 +2586,30 @@ class WrestlingDatabase:
                 # No gender label on the Open summary.
                 gender_prefix = ''
                 
-                html += '            <tr>\n'
+                parts.append('            <tr>\n')
                 
                 if row_idx == 0:
                     # First row in group — include No/Year/Venue/Location (with rowspan if group > 1)
                     rs = f' rowspan="{group_size}"' if group_size > 1 else ''
-                    html += f'                <th{rs}>{edition_num}</th>\n'
-                    html += f'                <td{rs}>{year}</td>\n'
-                    html += f'                <td>{gender_prefix}<span class="fi fi-{w_country}"></span> {self._wlink(t["winner"])}</td>\n'
-                    html += f'                <td><span class="fi fi-{r_country}"></span> {self._wlink(t["runner_up"])}</td>\n'
-                    html += f'                <td{rs}>{venue}</td>\n'
-                    html += f'                <td{rs}><span class="fi fi-{l_country}"></span> {location}</td>\n'
+                    parts.append(f'                <th{rs}>{edition_num}</th>\n')
+                    parts.append(f'                <td{rs}>{year}</td>\n')
+                    parts.append(f'                <td>{gender_prefix}<span class="fi fi-{w_country}"></span> {self._wlink(t["winner"])}</td>\n')
+                    parts.append(f'                <td><span class="fi fi-{r_country}"></span> {self._wlink(t["runner_up"])}</td>\n')
+                    parts.append(f'                <td{rs}>{venue}</td>\n')
+                    parts.append(f'                <td{rs}><span class="fi fi-{l_country}"></span> {location}</td>\n')
                 else:
                     # Subsequent rows in group — only Winner and Runner-Up columns
-                    html += f'                <td>{gender_prefix}<span class="fi fi-{w_country}"></span> {self._wlink(t["winner"])}</td>\n'
-                    html += f'                <td><span class="fi fi-{r_country}"></span> {self._wlink(t["runner_up"])}</td>\n'
+                    parts.append(f'                <td>{gender_prefix}<span class="fi fi-{w_country}"></span> {self._wlink(t["winner"])}</td>\n')
+                    parts.append(f'                <td><span class="fi fi-{r_country}"></span> {self._wlink(t["runner_up"])}</td>\n')
                 
-                html += '            </tr>\n'
+                parts.append('            </tr>\n')
             
             edition_num -= 1
         
-        html += '        </tbody>\n'
-        html += '    </table>\n'
+        parts.append('        </tbody>\n')
+        parts.append('    </table>\n')
         
-        return html
+        return ''.join(parts)
 
     def _infobox_row(self, label, value_html):
         return (f'                <tr>\n                    <th>{label}</th>\n'
@@ -2704,18 +2829,18 @@ class WrestlingDatabase:
         
         entries_sorted = sorted(entries, key=lambda t: t['year'], reverse=True)
         
-        html = '    <table class="match-card">\n'
-        html += '        <thead>\n'
-        html += '            <tr>\n'
-        html += '                <th>No.</th>\n'
-        html += '                <th>Year</th>\n'
-        html += '                <th>Winners</th>\n'
-        html += '                <th>Runners-Up</th>\n'
-        html += '                <th>Venue</th>\n'
-        html += '                <th>Location</th>\n'
-        html += '            </tr>\n'
-        html += '        </thead>\n'
-        html += '        <tbody>\n'
+        parts = ['    <table class="match-card">\n']
+        parts.append('        <thead>\n')
+        parts.append('            <tr>\n')
+        parts.append('                <th>No.</th>\n')
+        parts.append('                <th>Year</th>\n')
+        parts.append('                <th>Winners</th>\n')
+        parts.append('                <th>Runners-Up</th>\n')
+        parts.append('                <th>Venue</th>\n')
+        parts.append('                <th>Location</th>\n')
+        parts.append('            </tr>\n')
+        parts.append('        </thead>\n')
+        parts.append('        <tbody>\n')
         
         for idx, t in enumerate(entries_sorted):
             num = len(entries_sorted) - idx
@@ -2732,19 +2857,52 @@ class WrestlingDatabase:
                 for f in t['losers']
             )
             
-            html += '            <tr>\n'
-            html += f'                <th>{num}</th>\n'
-            html += f'                <td>{t["year"]}</td>\n'
-            html += f'                <td>{winners_html}</td>\n'
-            html += f'                <td>{losers_html}</td>\n'
-            html += f'                <td>{venue}</td>\n'
-            html += f'                <td><span class="fi fi-{l_country}"></span> {location}</td>\n'
-            html += '            </tr>\n'
-        
-        html += '        </tbody>\n'
-        html += '    </table>\n'
-        
-        return html
+            parts.append('            <tr>\n')
+            parts.append(f'                <th>{num}</th>\n')
+            parts.append(f'                <td>{t["year"]}</td>\n')
+            parts.append(f'                <td>{winners_html}</td>\n')
+            parts.append(f'                <td>{losers_html}</td>\n')
+            parts.append(f'                <td>{venue}</td>\n')
+            parts.append(f'                <td><span class="fi fi-{l_country}"></span> {location}</td>\n')
+            parts.append('            </tr>\n')
+        
+        parts.append('        </tbody>\n')
+        parts.append('    </table>\n')
+        
+        return ''.join(parts)
+
+    def matches_by_date(self):
+        """name -> that wrestler's matches, oldest first. The records pass and
+        every wrestler page want them in date order; each list is sorted once,
+        with each distinct date string parsed once (most cards share a date
+        and every match sits in two lists). Built after parsing, once the
+        match lists are final."""
+        if self._matches_by_date is None:
+            when = {}
+            for w in self.wrestlers.values():
+                for m in w['matches']:
+                    d = m.get('date')
+                    if d not in when:
+                        when[d] = self.parse_date(d) or datetime.min
+            self._matches_by_date = {
+                name: sorted(w['matches'], key=lambda m: when[m.get('date')])
+                for name, w in self.wrestlers.items()}
+        return self._matches_by_date
+
+    def reigns_by_champion(self):
+        """name -> [(org, weight, i), ...]: every reign a wrestler has held, as
+        an index into self.championships[org][weight], in org / weight /
+        chronological order. Built in one walk of the title histories and kept
+        until they are rebuilt, so per-wrestler questions (their titles, what
+        they held in a given period) don't each walk every history."""
+        if self._reigns_by_champion is None:
+            index = defaultdict(list)
+            for org in ['wwf', 'wwo', 'iwb', 'ring']:
+                for weight in ['heavyweight', 'bridgerweight', 'middleweight', 'welterweight', 'lightweight', 'featherweight']:
+                    for i, reign in enumerate(self.championships[org][weight]):
+                        index[reign['champion']].append((org, weight, i))
+            self._reigns_by_champion = index
+        return self._reigns_by_champion
 
     def get_wrestler_titles(self, wrestler_name):
         """Returns (current_titles, all_time_titles) for a wrestler.
@@ -2754,26 +2912,16 @@ class WrestlingDatabase:
         # Track all-time: key = (org, weight), value = number of reigns
         all_time = {}
         
-        for org in ['wwf', 'wwo', 'iwb', 'ring']:
-            for weight in ['heavyweight', 'bridgerweight', 'middleweight', 'welterweight', 'lightweight', 'featherweight']:
-                reigns = self.championships[org][weight]
-                reign_count = 0
-                for reign in reigns:
-                    if reign['champion'] == wrestler_name:
-                        reign_count += 1
-                
-                if reign_count == 0:
-                    continue
-                
-                # Build label
-                org_label = '<i>The Ring</i>' if org == 'ring' else org.upper()
-                weight_label = weight.capitalize()
-                
-                all_time[(org, weight)] = (f"{org_label} {weight_label}", reign_count)
-                
-                # Check if currently held: last reign is this wrestler and not vacated
-                if reigns and reigns[-1]['champion'] == wrestler_name and 'vacancy_message' not in reigns[-1]:
-                    current_titles.append(f"{org_label} {weight_label}")
+        # Only this wrestler's own reigns, from the shared index, rather than
+        # every title history. A belt is still held if its last reign is
+        # theirs and was not vacated.
+        for org, weight, i in self.reigns_by_champion().get(wrestler_name, ()):
+            reigns = self.championships[org][weight]
+            label, reign_count = all_time.get((org, weight), (_TITLE_LABEL[(org, weight)], 0))
+            all_time[(org, weight)] = (label, reign_count + 1)
+            
+            if i == len(reigns) - 1 and 'vacancy_message' not in reigns[i]:
+                current_titles.append(label)
         
         # Include Open Tournament wins
         open_wins = [t for t in self.tournaments.get('open_with_years', []) if t['winner'] == wrestler_name]
@@ -2795,12 +2943,8 @@ class WrestlingDatabase:
         w = self.wrestlers[wrestler_name]
         total_bouts = w['wins'] + w['losses'] + w['draws']
         
-        # Sort matches in chronological order (oldest first) to calculate running record
-        chronological_matches = sorted(
-            w['matches'], 
-            key=lambda x: self.parse_date(x['date']) if x.get('date') else datetime.min,
-            reverse=False  # Oldest first
-        )
+        # Matches in chronological order (oldest first) to calculate running record
+        chronological_matches = self.matches_by_date()[wrestler_name]
         
         # Recalculate running record in chronological order
         running_wins = 0
@@ -2816,7 +2960,7 @@ class WrestlingDatabase:
                 running_draws += 1
             
             # Update the match with the correct chronological record
-            match['record'] = f"{running_wins}-{running_losses}-{running_draws}"
+            match['record'] = (running_wins, running_losses, running_draws)
         
         # Now reverse for display (newest first)
         sorted_matches = list(reversed(chronological_matches))
@@ -2824,7 +2968,7 @@ class WrestlingDatabase:
         # Titles in Wrestling section (only if they've ever held a title)
         current_titles, all_time_titles = self.get_wrestler_titles(wrestler_name)
         if all_time_titles:
-            html = "<h3>Titles in Wrestling</h3>\n\n"
+            parts = ["<h3>Titles in Wrestling</h3>\n\n"]
             title_parts = []
             # Group tournaments first
             open_years  = sorted(
@@ -2849,51 +2993,51 @@ class WrestlingDatabase:
                     title_parts.append(f"{label} Championship ({count}x)")
                 else:
                     title_parts.append(f"{label} Championship")
-            html += '<p>' + ' <br>\n'.join(title_parts) + ' </p>\n\n'
+            parts.append('<p>' + ' <br>\n'.join(title_parts) + ' </p>\n\n')
         else:
-            html = ""
+            parts = []
 
-        html += "<h3>Professional wrestling record</h3>\n\n"
+        parts.append("<h3>Professional wrestling record</h3>\n\n")
         
         # Summary table
-        html += '<table class="matchesum">\n'
-        html += '    <tbody><tr>\n'
-        html += f'        <th>{total_bouts} fights</th>\n'
-        html += f'        <th>{w["wins"]} wins</th>\n'
-        html += f'        <th>{w["losses"]} losses</th>\n'
-        html += '    </tr>\n'
-        html += '    <tr>\n'
-        html += '        <th style="text-align: left;"> By pinfall</th>\n'
-        html += f'        <td class="win">{w["pinfall_wins"]}</td>\n'
-        html += f'        <td class="loss">{w["pinfall_losses"]}</td>\n'
-        html += '    </tr>\n'
-        html += '    <tr>\n'
-        html += '        <th style="text-align: left;"> By submission</th>\n'
-        html += f'        <td class="win">{w["submission_wins"]}</td>\n'
-        html += f'        <td class="loss">{w["submission_losses"]}</td>\n'
-        html += '    </tr>\n'
-        html += '    <tr>\n'
-        html += '        <th style="text-align: left;"> By decision</th>\n'
-        html += f'        <td class="win">{w["decision_wins"]}</td>\n'
-        html += f'        <td class="loss">{w["decision_losses"]}</td>\n'
-        html += '    </tr>\n'
-        html += '    <tr>\n'
-        html += '        <th style="text-align: left;"> Draws</th>\n'
-        html += f'        <td colspan="2" class="draw">{w["draws"]}</td>\n'
-        html += '    </tr>\n'
-        html += '</tbody></table>\n\n'
+        parts.append('<table class="matchesum">\n')
+        parts.append('    <tbody><tr>\n')
+        parts.append(f'        <th>{total_bouts} fights</th>\n')
+        parts.append(f'        <th>{w["wins"]} wins</th>\n')
+        parts.append(f'        <th>{w["losses"]} losses</th>\n')
+        parts.append('    </tr>\n')
+        parts.append('    <tr>\n')
+        parts.append('        <th style="text-align: left;"> By pinfall</th>\n')
+        parts.append(f'        <td class="win">{w["pinfall_wins"]}</td>\n')
+        parts.append(f'        <td class="loss">{w["pinfall_losses"]}</td>\n')
+        parts.append('    </tr>\n')
+        parts.append('    <tr>\n')
+        parts.append('        <th style="text-align: left;"> By submission</th>\n')
+        parts.append(f'        <td class="win">{w["submission_wins"]}</td>\n')
+        parts.append(f'        <td class="loss">{w["submission_losses"]}</td>\n')
+        parts.append('    </tr>\n')
+        parts.append('    <tr>\n')
+        parts.append('        <th style="text-align: left;"> By decision</th>\n')
+        parts.append(f'        <td class="win">{w["decision_wins"]}</td>\n')
+        parts.append(f'        <td class="loss">{w["decision_losses"]}</td>\n')
+        parts.append('    </tr>\n')
+        parts.append('    <tr>\n')
+        parts.append('        <th style="text-align: left;"> Draws</th>\n')
+        parts.append(f'        <td colspan="2" class="draw">{w["draws"]}</td>\n')
+        parts.append('    </tr>\n')
+        parts.append('</tbody></table>\n\n')
 
         # Matches table
-        html += '<table class="matches">\n'
-        html += '    <tbody><tr>\n'
-        html += '        <th>No.</th>\n'
-        html += '        <th>Res.</th>\n'
-        html += '        <th>Record</th>\n'
-        html += '        <th>Opponent</th>\n'
-        html += '        <th>Date</th>\n'
-        html += '        <th>Event</th>\n'
-        html += '        <th>Notes</th>\n'
-        html += '    </tr>\n'
+        parts.append('<table class="matches">\n')
+        parts.append('    <tbody><tr>\n')
+        parts.append('        <th>No.</th>\n')
+        parts.append('        <th>Res.</th>\n')
+        parts.append('        <th>Record</th>\n')
+        parts.append('        <th>Opponent</th>\n')
+        parts.append('        <th>Date</th>\n')
+        parts.append('        <th>Event</th>\n')
+        parts.append('        <th>Notes</th>\n')
+        parts.append('    </tr>\n')
 
         # Broadcast (PPV/TV/STM + audience) lookup by (event, date)
         broadcast_lookup = {(b['event'], b['date']): b for b in self.broadcasts}
@@ -2910,9 +3054,9 @@ class WrestlingDatabase:
             opponent_country = match['fighter2_country'] if match['fighter1'] == w['name'] else match['fighter1_country']
             result_class = match['result'].lower()
             
-            html += '    <tr>\n'
-            html += f'        <th>{total_bouts - idx}</th>\n'
-            html += f'        <td class="{result_class}">{match["result"]}</td>\n'
+            parts.append('    <tr>\n')
+            parts.append(f'        <th>{total_bouts - idx}</th>\n')
+            parts.append(f'        <td class="{result_class}">{match["result"]}</td>\n')
             # Record cell: record on top, card position (Main Event / Mid Card /
             # Undercard) underneath (gray).
             if 'open tournament' in (match.get('notes') or '').lower():
@@ -2928,10 +3072,12 @@ class WrestlingDatabase:
                         card_pos = 'Mid Card'
                     else:
                         card_pos = 'Undercard'
-            record_cell = match["record"]
+            # Records are kept as (wins, losses, draws) and only formatted here
+            rec = match["record"]
+            record_cell = f"{rec[0]}-{rec[1]}-{rec[2]}"
             if card_pos:
                 record_cell += f'<br><span class="sub">{card_pos}</span>'
-            html += f'        <td>{record_cell}</td>\n'
+            parts.append(f'        <td>{record_cell}</td>\n')
             # Event cell: full event name on top, flag + location smaller underneath
             event_cell = match["event"]
             if match["location"]:
@@ -2942,7 +3088,7 @@ class WrestlingDatabase:
             if match["method"]:
                 _verb = 'drew by' if match['result'] == 'Draw' else 'def. by'
                 opponent_cell += f'<br><span class="sub">{_verb} {match["method"]}</span>'
-            html += f'        <td>{opponent_cell}</td>\n'
+            parts.append(f'        <td>{opponent_cell}</td>\n')
             # Date cell: date on top, broadcast type + audience underneath (gray)
             date_cell = f'<a href="/wrestling/ppv/list.html">{match["date"]}</a>'
             _bc = broadcast_lookup.get((match["event"], match["date"]))
@@ -2951,8 +3097,8 @@ class WrestlingDatabase:
                 _unit = {'PPV': 'buys', 'TV': 'viewers', 'STM': 'streams'}.get(_bt, '')
                 _line = ' '.join(x for x in (_bt, _bc["audience_metric"], _unit) if x)
                 date_cell += f'<br><span class="sub">{_line}</span>'
-            html += f'        <td>{date_cell}</td>\n'
-            html += f'        <td>{event_cell}</td>\n'
+            parts.append(f'        <td>{date_cell}</td>\n')
+            parts.append(f'        <td>{event_cell}</td>\n')
             # Notes cell: weight class on top (normal), note underneath (gray).
             # Strip the weight word from the note so it isn't repeated.
             _note = match.get("bio_notes", match["notes"]) or ""
@@ -2963,11 +3109,11 @@ class WrestlingDatabase:
             notes_cell = _wc
             if _note:
                 notes_cell += f'<br><span class="sub">{_note}</span>'
-            html += f'        <td>{notes_cell}</td>\n'
-            html += '    </tr>\n'
+            parts.append(f'        <td>{notes_cell}</td>\n')
+            parts.append('    </tr>\n')
 
-        html += '</tbody></table>\n'
-        return html
+        parts.append('</tbody></table>\n')
+        return ''.join(parts)
 
     def _wlink(self, name):
         """Link a wrestler name to their page — only when a page is actually
@@ -3015,7 +3161,14 @@ class WrestlingDatabase:
         w = self.wrestlers.get(name)
         if not w:
             return ''
-        return self._year_suffix(self._match_years(w, pred or (lambda m: True)))
+        if pred is not None:
+            return self._year_suffix(self._match_years(w, pred))
+        # Career span: the same champions turn up across most record tables,
+        # so each one's match history is scanned once, not once per table.
+        if name not in self._career_suffix:
+            self._career_suffix[name] = self._year_suffix(
+                self._match_years(w, lambda m: True))
+        return self._career_suffix[name]
 
     _LEADING = ('El ', 'La ', 'Los ', 'Las ', 'The ')
 
@@ -3078,19 +3231,19 @@ class WrestlingDatabase:
         sorted_totals = sorted(totals.items(), key=lambda x: x[1]['days'], reverse=True)
         
         # Build history table
-        html = f'    <!-- {org.upper()} {weight.capitalize()} Championship -->\n'
-        html += '    <details>\n'
+        parts = [f'    <!-- {org.upper()} {weight.capitalize()} Championship -->\n']
+        parts.append('    <details>\n')
         org_display = 'The Ring' if org == 'ring' else org.upper()
-        html += f'    <summary>{org_display} World {weight.capitalize()} Champion</summary>\n'
-        html += '        <table class="champ-history">\n'
-        html += '        <tr>\n'
-        html += '            <th>No.</th>\n'
-        html += '            <th>Champion</th>\n'
-        html += '            <th>Event</th>\n'
-        html += '            <th>Date</th>\n'
-        html += '            <th>Days</th>\n'
-        html += '            <th>Defenses</th>\n'
-        html += '        </tr>\n'
+        parts.append(f'    <summary>{org_display} World {weight.capitalize()} Champion</summary>\n')
+        parts.append('        <table class="champ-history">\n')
+        parts.append('        <tr>\n')
+        parts.append('            <th>No.</th>\n')
+        parts.append('            <th>Champion</th>\n')
+        parts.append('            <th>Event</th>\n')
+        parts.append('            <th>Date</th>\n')
+        parts.append('            <th>Days</th>\n')
+        parts.append('            <th>Defenses</th>\n')
+        parts.append('        </tr>\n')
         
         max_defenses = max((reign['defenses'] for reign in reigns), default=0)
         
@@ -3135,49 +3288,49 @@ class WrestlingDatabase:
                 defenses_cell = '<span class="sub">' + '<br>'.join(_dparts) + '</span>'
             else:
                 defenses_cell = '0'
-            html += '        <tr>\n'
-            html += f'            <th>{idx + 1}</th>\n'
-            html += f'            <td>{_champ}</td>\n'
-            html += f'            <td>{_event}</td>\n'
-            html += f'            <td>{reign["date"]}</td>\n'
-            html += f'            <td>{days_display}</td>\n'
-            html += f'            <td class="defenses">{defenses_cell}</td>\n'
-            html += '        </tr>\n'
+            parts.append('        <tr>\n')
+            parts.append(f'            <th>{idx + 1}</th>\n')
+            parts.append(f'            <td>{_champ}</td>\n')
+            parts.append(f'            <td>{_event}</td>\n')
+            parts.append(f'            <td>{reign["date"]}</td>\n')
+            parts.append(f'            <td>{days_display}</td>\n')
+            parts.append(f'            <td class="defenses">{defenses_cell}</td>\n')
+            parts.append('        </tr>\n')
             
             # Add vacancy message if exists
             if 'vacancy_message' in reign:
-                html += '        <tr>\n'
-                html += f'            <th colspan="6" style="font-size:0.8em; line-height:1.3; text-align:center;">\n'
-                html += f'                {reign["vacancy_message"]}\n'
-                html += '            </th>\n'
-                html += '        </tr>\n'
+                parts.append('        <tr>\n')
+                parts.append(f'            <th colspan="6" style="font-size:0.8em; line-height:1.3; text-align:center;">\n')
+                parts.append(f'                {reign["vacancy_message"]}\n')
+                parts.append('            </th>\n')
+                parts.append('        </tr>\n')
         
-        html += '    </table>\n'
+        parts.append('    </table>\n')
         
         # Totals table
-        html += '    <!-- Champ Totals Table -->\n'
-        html += '        <table style="width: 75%;" class="totals">\n'
-        html += '        <tr>\n'
-        html += '            <th>Rank</th>\n'
-        html += '            <th>Wrestler</th>\n'
-        html += '            <th>No. of reigns</th>\n'
-        html += '            <th>Total days</th>\n'
-        html += '            <th>Defenses</th>\n'
-        html += '        </tr>\n'
+        parts.append('    <!-- Champ Totals Table -->\n')
+        parts.append('        <table style="width: 75%;" class="totals">\n')
+        parts.append('        <tr>\n')
+        parts.append('            <th>Rank</th>\n')
+        parts.append('            <th>Wrestler</th>\n')
+        parts.append('            <th>No. of reigns</th>\n')
+        parts.append('            <th>Total days</th>\n')
+        parts.append('            <th>Defenses</th>\n')
+        parts.append('        </tr>\n')
         
         for idx, (champ, stats) in enumerate(sorted_totals):
-            html += '        <tr>\n'
-            html += f'            <th>{idx + 1}</th>\n'
-            html += f'            <td><span class="fi fi-{stats["country"]}"></span> {self._wlink(champ)}</td>\n'
-            html += f'            <td>{stats["reigns"]}</td>\n'
-            html += f'            <td>{self.format_number(stats["days"])}</td>\n'
-            html += f'            <td>{stats["defenses"]}</td>\n'
-            html += '        </tr>\n'
+            parts.append('        <tr>\n')
+            parts.append(f'            <th>{idx + 1}</th>\n')
+            parts.append(f'            <td><span class="fi fi-{stats["country"]}"></span> {self._wlink(champ)}</td>\n')
+            parts.append(f'            <td>{stats["reigns"]}</td>\n')
+            parts.append(f'            <td>{self.format_number(stats["days"])}</td>\n')
+            parts.append(f'            <td>{stats["defenses"]}</td>\n')
+            parts.append('        </tr>\n')
         
-        html += '    </table>\n'
-        html += '    </details>\n\n'
+        parts.append('    </table>\n')
+        parts.append('    </details>\n\n')
         
-        return html
+        return ''.join(parts)
 
     def generate_current_champions_html(self):
         """Generate current champions summary. Wrapped in NOABBR so its dates
@@ -3264,6 +3417,25 @@ class WrestlingDatabase:
         out.append('    </table>')
         return '\n'.join(out) + '\n'
 
+    def _title_bout_counts(self):
+        """(per_org, any_org): decided title bouts per fighter, for each org
+        and for any title at all. The four org record pages and the world-title
+        totals all need these, so every card is walked once for the lot."""
+        if self._title_bouts is None:
+            per_org = defaultdict(lambda: defaultdict(int))
+            any_org = defaultdict(int)
+            for event in self.events:
+                for match in event['matches']:
+                    is_title, orgs = self.is_title_match(match['notes'])
+                    if not is_title or not match['winner']:
+                        continue
+                    for f in (match['fighter1'], match['fighter2']):
+                        any_org[f] += 1
+                        for org in orgs:
+                            per_org[org][f] += 1
+            self._title_bouts = (per_org, any_org)
+        return self._title_bouts
+
     def _world_title_totals(self):
         """Per-wrestler world-title aggregates. Overlapping belts held at once
         count as ONE continuous reign period (adding a belt mid-reign doesn't
@@ -3287,13 +3459,10 @@ class WrestlingDatabase:
 
         totals = defaultdict(lambda: {'name': '', 'country': 'un', 'total_reigns': 0,
                                       'total_defenses': 0, 'total_days': 0, 'title_bouts': 0})
-        for event in self.events:
-            for match in event['matches']:
-                is_title, orgs = self.is_title_match(match['notes'])
-                if is_title and match['winner'] and any(o in world_orgs for o in orgs):
-                    for f in (match['fighter1'], match['fighter2']):
-                        if f in wrestler_reigns:
-                            totals[f]['title_bouts'] += 1
+        _per_org, any_org = self._title_bout_counts()
+        for f, n in any_org.items():
+            if f in wrestler_reigns:
+                totals[f]['title_bouts'] = n
 
         for champ, reigns in wrestler_reigns.items():
             merged = []
@@ -3332,25 +3501,52 @@ class WrestlingDatabase:
         def rows(pool, value_fn):
             return [(w.get('country', 'un'), w['name'], value_fn(w)) for w in pool]
 
-        # Champions who ever held a world belt (for Gatekeeper).
+        # One walk of the reigns: champions who ever held a world belt (for
+        # Gatekeeper), plus single-reign title streaks (max defenses / days in
+        # one reign).
         champ_set = set()
-        for org in ('wwf', 'wwo', 'iwb'):
-            for wt in self.championships[org]:
-                for r in self.championships[org][wt]:
-                    champ_set.add(r['champion'])
+        max_def, max_days, reign_country = defaultdict(int), defaultdict(int), {}
+        for org in ('wwf', 'wwo', 'iwb', 'ring'):
+            for wtk in ['heavyweight', 'bridgerweight', 'middleweight',
+                        'welterweight', 'lightweight', 'featherweight']:
+                for reign in self.championships[org][wtk]:
+                    champ = reign['champion']
+                    if org != 'ring':
+                        champ_set.add(champ)
+                    max_def[champ] = max(max_def[champ], reign['defenses'] or 0)
+                    max_days[champ] = max(max_days[champ], reign['days'] or 0)
+                    reign_country[champ] = reign['country']
+        def kv_rows(d, fmt=lambda v: v):
+            items = sorted(((k, v) for k, v in d.items() if v > 0), key=lambda kv: -kv[1])[:10]
+            return [(reign_country.get(k, 'un'), k, fmt(v)) for k, v in items]
+
+        by_date = self.matches_by_date()
 
-        # New per-wrestler stats: contender wins, competitive (decision) losses,
-        # distinct champions faced, and PPV bouts/wins.
+        # Per-wrestler stats in one chronological pass: contender wins,
+        # competitive (decision) losses, distinct champions faced, PPV
+        # bouts/wins, and the longest win / loss streaks.
         for w in W:
-            cw = cl = 0
+            cw = cl = ppv_bouts = ppv_wins = 0
+            sw = sl = mw = ml = 0
             faced = set()
-            for m in w['matches']:
+            for m in by_date[w['name']]:
+                result = m.get('result')
+                if result == 'Win':
+                    sw += 1; sl = 0; mw = max(mw, sw)
+                elif result == 'Loss':
+                    sl += 1; sw = 0; ml = max(ml, sl)
+                else:
+                    sw = sl = 0
+                if m.get('event', '') != 'Live TV':
+                    ppv_bouts += 1
+                    if result == 'Win':
+                        ppv_wins += 1
                 notes = (m.get('notes') or '').lower()
-                if m.get('result') == 'Win' and 'contender' in notes:
+                if result == 'Win' and 'contender' in notes:
                     cw += 1
                 # Competitive loss = lost without being finished (not pinned or
                 # submitted): a count-out / DQ / time-limit result.
-                if (m.get('result') == 'Loss' and m.get('method')
+                if (result == 'Loss' and m.get('method')
                         and m.get('method') not in ('Pinfall', 'Submission')):
                     cl += 1
                 opp = m['fighter2'] if m.get('fighter1') == w['name'] else m.get('fighter1')
@@ -3359,9 +3555,10 @@ class WrestlingDatabase:
             w['_contender_wins'] = cw
             w['_competitive_losses'] = cl
             w['_champs_faced'] = len(faced)
-            w['_ppv_bouts'] = sum(1 for m in w['matches'] if m.get('event', '') != 'Live TV')
-            w['_ppv_wins'] = sum(1 for m in w['matches']
-                                 if m.get('result') == 'Win' and m.get('event', '') != 'Live TV')
+            w['_ppv_bouts'] = ppv_bouts
+            w['_ppv_wins'] = ppv_wins
+            w['_win_streak'] = mw
+            w['_loss_streak'] = ml
 
         wt = sorted(self._world_title_totals().values(),
                     key=lambda s: s['total_reigns'], reverse=True)
@@ -3369,35 +3566,6 @@ class WrestlingDatabase:
             return [(s['country'], s['name'], key(s))
                     for s in sorted(wt, key=key, reverse=True)[:10] if key(s)]
 
-        # Single-reign title streaks (max defenses / days in one reign).
-        max_def, max_days, reign_country = defaultdict(int), defaultdict(int), {}
-        for org in ('wwf', 'wwo', 'iwb', 'ring'):
-            for wtk in ['heavyweight', 'bridgerweight', 'middleweight',
-                        'welterweight', 'lightweight', 'featherweight']:
-                for reign in self.championships[org][wtk]:
-                    champ = reign['champion']
-                    max_def[champ] = max(max_def[champ], reign['defenses'] or 0)
-                    max_days[champ] = max(max_days[champ], reign['days'] or 0)
-                    reign_country[champ] = reign['country']
-        def kv_rows(d, fmt=lambda v: v):
-            items = sorted(((k, v) for k, v in d.items() if v > 0), key=lambda kv: -kv[1])[:10]
-            return [(reign_country.get(k, 'un'), k, fmt(v)) for k, v in items]
-
-        # Consecutive win / loss streaks from each wrestler's match history.
-        for w in W:
-            ms = sorted(w['matches'], key=lambda x: self.parse_date(x.get('date')) or datetime.min)
-            cw = cl = mw = ml = 0
-            for m in ms:
-                r = m.get('result')
-                if r == 'Win':
-                    cw += 1; cl = 0; mw = max(mw, cw)
-                elif r == 'Loss':
-                    cl += 1; cw = 0; ml = max(ml, cl)
-                else:
-                    cw = cl = 0
-            w['_win_streak'] = mw
-            w['_loss_streak'] = ml
-
         rt = self._rec_table
         narrow = [
             # ── World titles (most prestigious) ──────────────────────────────
@@ -3516,13 +3684,10 @@ class WrestlingDatabase:
                 stats[champ]['total_defenses'] += reign.get('defenses') or 0
                 stats[champ]['total_days'] += reign.get('days') or 0
                 stats[champ]['country'] = reign.get('country', 'un')
-        for event in self.events:
-            for match in event['matches']:
-                is_title, orgs = self.is_title_match(match['notes'])
-                if is_title and org in orgs and match['winner']:
-                    for f in (match['fighter1'], match['fighter2']):
-                        if f in stats:
-                            stats[f]['title_bouts'] += 1
+        per_org, _any_org = self._title_bout_counts()
+        for f, n in per_org[org].items():
+            if f in stats:
+                stats[f]['title_bouts'] = n
 
         def org_rows(key, fmt=lambda v: v):
             ranked = sorted(stats.items(), key=lambda kv: kv[1][key], reverse=True)[:5]
@@ -3605,21 +3770,23 @@ class WrestlingDatabase:
         """World Titles: Titles Won, Title Defenses, Days as Champion, Title Bouts"""
         wrestler_list = list(self.wrestlers.values())
         
-        # Calculate title stats (exclude Ring org)
+        # Calculate title stats (exclude Ring org), from each wrestler's own
+        # reigns in the shared index rather than every history per wrestler
+        by_champ = self.reigns_by_champion()
         wrestler_title_stats = []
         for w in wrestler_list:
             reigns_count = 0
             total_defenses = 0
             total_days = 0
             title_bouts = 0
-            
-            for org in ['wwf', 'wwo', 'iwb']:
-                for weight in ['heavyweight', 'bridgerweight', 'middleweight', 'welterweight', 'lightweight', 'featherweight']:
-                    for reign in self.championships[org][weight]:
-                        if reign['champion'] == w['name']:
-                            reigns_count += 1
-                            total_defenses += reign.get('defenses') or 0
-                            total_days += reign.get('days') or 0
+
+            for org, weight, i in by_champ.get(w['name'], ()):
+                if org == 'ring':
+                    continue
+                reign = self.championships[org][weight][i]
+                reigns_count += 1
+                total_defenses += reign.get('defenses') or 0
+                total_days += reign.get('days') or 0
             
             # Count title bouts from matches
             for match in w['matches']:
@@ -3918,7 +4085,7 @@ class WrestlingDatabase:
 
     def generate_undisputed_champions_html(self):
         """Generate undisputed champions section"""
-        html = '<h2>List of Undisputed Champions</h2>\n\n'
+        parts = ['<h2>List of Undisputed Champions</h2>\n\n']
         
         # Build event lookup: (name, date) -> {location, country}
         event_lookup = {}
@@ -3950,21 +4117,21 @@ class WrestlingDatabase:
             if not reigns:
                 continue
             
-            html += f'    <!-- Undisputed {weight.capitalize()} Championship -->\n'
-            html += '    <details>\n'
-            html += f'    <summary>Undisputed World {weight.capitalize()} Champion {limit}</summary>\n'
-            html += '        <table class="champ-history">\n'
-            html += '        <tr>\n'
-            html += '            <th>No.</th>\n'
-            html += '            <th>Champion</th>\n'
-            html += '            <th>Date Start</th>\n'
-            html += '            <th>Date End</th>\n'
-            html += '            <th>Event</th>\n'
-            html += '            <th>Location</th>\n'
-            html += '            <th>Days</th>\n'
-            html += '            <th>Defenses</th>\n'
-            html += '            <th>Notes</th>\n'
-            html += '        </tr>\n'
+            parts.append(f'    <!-- Undisputed {weight.capitalize()} Championship -->\n')
+            parts.append('    <details>\n')
+            parts.append(f'    <summary>Undisputed World {weight.capitalize()} Champion {limit}</summary>\n')
+            parts.append('        <table class="champ-history">\n')
+            parts.append('        <tr>\n')
+            parts.append('            <th>No.</th>\n')
+            parts.append('            <th>Champion</th>\n')
+            parts.append('            <th>Date Start</th>\n')
+            parts.append('            <th>Date End</th>\n')
+            parts.append('            <th>Event</th>\n')
+            parts.append('            <th>Location</th>\n')
+            parts.append('            <th>Days</th>\n')
+            parts.append('            <th>Defenses</th>\n')
+            parts.append('            <th>Notes</th>\n')
+            parts.append('        </tr>\n')
             
             max_defenses = max(((reign.get('defenses') or 0) for reign in reigns), default=0)
             
@@ -3993,30 +4160,30 @@ class WrestlingDatabase:
                 location = evt.get('location', '')
                 location_country = evt.get('country', 'un')
                 
-                html += '        <tr>\n'
-                html += f'            <th>{idx + 1}</th>\n'
-                html += f'            <td><span class="fi fi-{country}"></span> {self._wlink(reign["champion"])}</td>\n'
-                html += f'            <td>{start_str}</td>\n'
-                html += f'            <td>{end_str}</td>\n'
-                html += f'            <td>{event_name}</td>\n'
-                html += f'            <td><span class="fi fi-{location_country}"></span> {location}</td>\n'
-                html += f'            <td>{self.format_number(days)}</td>\n'
-                html += f'            <{def_tag}>{def_count}</{def_tag}>\n'
-                html += f'            <td>{reign.get("notes", "")}</td>\n'
-                html += '        </tr>\n'
+                parts.append('        <tr>\n')
+                parts.append(f'            <th>{idx + 1}</th>\n')
+                parts.append(f'            <td><span class="fi fi-{country}"></span> {self._wlink(reign["champion"])}</td>\n')
+                parts.append(f'            <td>{start_str}</td>\n')
+                parts.append(f'            <td>{end_str}</td>\n')
+                parts.append(f'            <td>{event_name}</td>\n')
+                parts.append(f'            <td><span class="fi fi-{location_country}"></span> {location}</td>\n')
+                parts.append(f'            <td>{self.format_number(days)}</td>\n')
+                parts.append(f'            <{def_tag}>{def_count}</{def_tag}>\n')
+                parts.append(f'            <td>{reign.get("notes", "")}</td>\n')
+                parts.append('        </tr>\n')
                 
                 # Add loss message row if exists (like vacancy messages)
                 if reign.get('loss_message'):
-                    html += '        <tr>\n'
-                    html += f'            <th colspan="9" style="font-size:0.8em; line-height:1.3; text-align:center;">\n'
-                    html += f'                {reign["loss_message"]}\n'
-                    html += '            </th>\n'
-                    html += '        </tr>\n'
+                    parts.append('        <tr>\n')
+                    parts.append(f'            <th colspan="9" style="font-size:0.8em; line-height:1.3; text-align:center;">\n')
+                    parts.append(f'                {reign["loss_message"]}\n')
+                    parts.append('            </th>\n')
+                    parts.append('        </tr>\n')
             
-            html += '    </table>\n'
-            html += '    </details>\n\n'
+            parts.append('    </table>\n')
+            parts.append('    </details>\n\n')
         
-        return html
+        return ''.join(parts)
 
     def generate_apuestas_html(self):
         """Generate Lucha de Apuestas table"""
@@ -4030,18 +4197,18 @@ class WrestlingDatabase:
             reverse=True
         )
         
-        html = '    <!-- Apuestas Records -->\n'
-        html += '    <table class="match-card apuestas-card">\n'
-        html += '    <thead>\n'
-        html += '        <tr>\n'
-        html += '            <th>No.</th>\n'
-        html += '            <th>Winner</th>\n'
-        html += '            <th>Event</th>\n'
-        html += '            <th>Date</th>\n'
-        html += '            <th>Wager</th>\n'
-        html += '        </tr>\n'
-        html += '    </thead>\n'
-        html += '    <tbody>\n'
+        parts = ['    <!-- Apuestas Records -->\n']
+        parts.append('    <table class="match-card apuestas-card">\n')
+        parts.append('    <thead>\n')
+        parts.append('        <tr>\n')
+        parts.append('            <th>No.</th>\n')
+        parts.append('            <th>Winner</th>\n')
+        parts.append('            <th>Event</th>\n')
+        parts.append('            <th>Date</th>\n')
+        parts.append('            <th>Wager</th>\n')
+        parts.append('        </tr>\n')
+        parts.append('    </thead>\n')
+        parts.append('    <tbody>\n')
 
         for idx, apuesta in enumerate(sorted_apuestas):
             winner_country = self.wrestlers.get(apuesta['winner'], {}).get('country', 'un')
@@ -4061,21 +4228,21 @@ class WrestlingDatabase:
             if apuesta.get("venue"):
                 date_cell += f'<br><span class="sub">{apuesta["venue"]}</span>'
 
-            html += '        <tr>\n'
+            parts.append('        <tr>\n')
             # Rows run newest-first, but the numbering is chronological: the
             # first apuesta ever is No. 1 and the most recent takes the last
             # number, so a given bout keeps its number as new ones are added.
-            html += f'            <th>{len(sorted_apuestas) - idx}</th>\n'
-            html += f'            <td>{winner_cell}</td>\n'
-            html += f'            <td>{event_cell}</td>\n'
-            html += f'            <td>{date_cell}</td>\n'
-            html += f'            <td>{apuesta["wager"]}</td>\n'
-            html += '        </tr>\n'
+            parts.append(f'            <th>{len(sorted_apuestas) - idx}</th>\n')
+            parts.append(f'            <td>{winner_cell}</td>\n')
+            parts.append(f'            <td>{event_cell}</td>\n')
+            parts.append(f'            <td>{date_cell}</td>\n')
+            parts.append(f'            <td>{apuesta["wager"]}</td>\n')
+            parts.append('        </tr>\n')
 
-        html += '    </tbody>\n'
-        html += '    </table>\n\n'
+        parts.append('    </tbody>\n')
+        parts.append('    </table>\n\n')
 
-        return html
+        return ''.join(parts)
 
     def generate_streaks_records_html(self):
         """Generate streaks records table - consecutive wins, losses, defenses, days"""
@@ -5021,26 +5188,17 @@ class WrestlingDatabase:
             
             # Update summary championships
             current_champs_html = self.generate_current_champions_html()
-            if '<!-- SUMMARYCHAMPS_START -->' in content and '<!-- SUMMARYCHAMPS_END -->' in content:
-                before = content.split('<!-- SUMMARYCHAMPS_START -->')[0]
-                after = content.split('<!-- SUMMARYCHAMPS_END -->')[1]
-                content = before + '<!-- SUMMARYCHAMPS_START -->\n' + current_champs_html + '<!-- SUMMARYCHAMPS_END -->' + after
+            content = _splice(content, '<!-- SUMMARYCHAMPS_START -->', '<!-- SUMMARYCHAMPS_END -->', current_champs_html)
             
             # Update undisputed champions
             undisputed_html = self.generate_undisputed_champions_html()
-            if '<!-- UNDISPUTED_START -->' in content and '<!-- UNDISPUTED_END -->' in content:
-                before = content.split('<!-- UNDISPUTED_START -->')[0]
-                after = content.split('<!-- UNDISPUTED_END -->')[1]
-                content = before + '<!-- UNDISPUTED_START -->\n' + undisputed_html + '<!-- UNDISPUTED_END -->' + after
+            content = _splice(content, '<!-- UNDISPUTED_START -->', '<!-- UNDISPUTED_END -->', undisputed_html)
             
             # (Open & Trios tournaments now live on wrestling/tournaments.html.)
 
             # Update apuestas
             apuestas_html = self.generate_apuestas_html()
-            if '<!-- APUESTAS_START -->' in content and '<!-- APUESTAS_END -->' in content:
-                before = content.split('<!-- APUESTAS_START -->')[0]
-                after = content.split('<!-- APUESTAS_END -->')[1]
-                content = before + '<!-- APUESTAS_START -->\n' + apuestas_html + '<!-- APUESTAS_END -->' + after
+            content = _splice(content, '<!-- APUESTAS_START -->', '<!-- APUESTAS_END -->', apuestas_html)
             
             with open(wiki_path, 'w', encoding='utf-8') as f:
                 f.write(content)
@@ -5052,10 +5210,7 @@ class WrestlingDatabase:
             with open(records_path, 'r', encoding='utf-8') as f:
                 content = f.read()
             records_html = self.generate_records_html()
-            if '<!-- RECORDS_START -->' in content and '<!-- RECORDS_END -->' in content:
-                before = content.split('<!-- RECORDS_START -->')[0]
-                after = content.split('<!-- RECORDS_END -->')[1]
-                content = before + '<!-- RECORDS_START -->\n' + records_html + '<!-- RECORDS_END -->' + after
+            content = _splice(content, '<!-- RECORDS_START -->', '<!-- RECORDS_END -->', records_html)
             with open(records_path, 'w', encoding='utf-8') as f:
                 f.write(content)
             print(f"✓ Updated {records_path}")
@@ -5075,8 +5230,7 @@ class WrestlingDatabase:
             ]
             for marker, html in sections:
                 s, e = f'<!-- {marker}_START -->', f'<!-- {marker}_END -->'
-                if s in content and e in content:
-                    content = content.split(s)[0] + s + '\n' + html + e + content.split(e)[1]
+                content = _splice(content, s, e, html)
             with open(tournaments_path, 'w', encoding='utf-8') as f:
                 f.write(content)
             print(f"✓ Updated {tournaments_path}")
@@ -5089,9 +5243,7 @@ class WrestlingDatabase:
                 content = f.read()
             s, e = '<!-- AUDIENCE_START -->', '<!-- AUDIENCE_END -->'
             if s in content and e in content:
-                content = (content.split(s)[0] + s + '\n'
-                           + self.generate_audience_records_html() + e
-                           + content.split(e)[1])
+                content = _splice(content, s, e, self.generate_audience_records_html())
                 with open(schedule_path, 'w', encoding='utf-8') as f:
                     f.write(content)
                 print(f"✓ Updated {schedule_path}")
@@ -5108,17 +5260,13 @@ class WrestlingDatabase:
                 for weight in ['heavyweight', 'bridgerweight', 'middleweight', 'welterweight', 'lightweight', 'featherweight']:
                     org_champs_html += self.generate_championship_history_html(org, weight)
                 
-                if f'<!-- {org.upper()}CHAMPS_START -->' in content and f'<!-- {org.upper()}CHAMPS_END -->' in content:
-                    before = content.split(f'<!-- {org.upper()}CHAMPS_START -->')[0]
-                    after = content.split(f'<!-- {org.upper()}CHAMPS_END -->')[1]
-                    content = before + f'<!-- {org.upper()}CHAMPS_START -->\n' + org_champs_html + f'<!-- {org.upper()}CHAMPS_END -->' + after
+                content = _splice(content, f'<!-- {org.upper()}CHAMPS_START -->',
+                                  f'<!-- {org.upper()}CHAMPS_END -->', org_champs_html)
                 
                 # Add org records table
                 org_records_html = self.generate_single_org_records_html(org)
-                if f'<!-- {org.upper()}RECORDS_START -->' in content and f'<!-- {org.upper()}RECORDS_END -->' in content:
-                    before = content.split(f'<!-- {org.upper()}RECORDS_START -->')[0]
-                    after = content.split(f'<!-- {org.upper()}RECORDS_END -->')[1]
-                    content = before + f'<!-- {org.upper()}RECORDS_START -->\n' + org_records_html + f'<!-- {org.upper()}RECORDS_END -->' + after
+                content = _splice(content, f'<!-- {org.upper()}RECORDS_START -->',
+                                  f'<!-- {org.upper()}RECORDS_END -->', org_records_html)
                     
                 with open(org_path, 'w', encoding='utf-8') as f:
                     f.write(content)
@@ -5164,20 +5312,14 @@ class WrestlingDatabase:
                     content = f.read()
                 
                 if '<!-- MATCHES_START -->' in content and '<!-- MATCHES_END -->' in content:
-                    before = content.split('<!-- MATCHES_START -->')[0]
-                    after = content.split('<!-- MATCHES_END -->')[1]
-                    content = before + '<!-- MATCHES_START -->\n' + wrestler_html + '<!-- MATCHES_END -->' + after
+                    content = _splice(content, '<!-- MATCHES_START -->', '<!-- MATCHES_END -->',
+                                      wrestler_html)
                     
                     # Update infobox record if it exists
                     wrestler = self.wrestlers[wrestler_name]
                     record = f"{wrestler['wins']}-{wrestler['losses']}-{wrestler['draws']}"
                     # Look for the Record row in infobox and update it
-                    import re
-                    content = re.sub(
-                        r'(<th>(?:Career )?Record</th>\s*<td>)[^<]*(</td>)',
-                        r'\g<1>' + record + r'\g<2>',
-                        content
-                    )
+                    content = _PAGE_RECORD_RE.sub(r'\g<1>' + record + r'\g<2>', content)
                     
                     # Update or add/remove Titles row — only if infobox exists.
                     # Titles is the last row of the box, below the ranking rows
@@ -5188,16 +5330,10 @@ class WrestlingDatabase:
                     # and re-appended rather than edited in place because a page
                     # written under the old rule has it in the wrong position
                     # and that is the only way to move it.
-                    box = re.search(r'<div class="infobox".*?</table>',
-                                    content, re.DOTALL)
+                    box = _PAGE_INFOBOX_RE.search(content)
                     if box:
                         current_titles, _ = self.get_wrestler_titles(wrestler_name)
-                        block = re.sub(
-                            r'\s*<tr>\s*<th>Titles</th>\s*<td>.*?</td>\s*</tr>',
-                            '',
-                            box.group(0),
-                            flags=re.DOTALL
-                        )
+                        block = _TITLES_ROW_RE.sub('', box.group(0))
                         if current_titles:
                             titles_row = (
                                 '\n                <tr>\n'
@@ -5206,12 +5342,8 @@ class WrestlingDatabase:
                                 + ' <br> '.join(current_titles) + '</td>\n'
                                 '                </tr>'
                             )
-                            block = re.sub(
-                                r'\s*(?:</tbody>)?\s*</table>',
-                                lambda m: titles_row + m.group(0),
-                                block,
-                                count=1
-                            )
+                            block = _TABLE_END_RE.sub(lambda m: titles_row + m.group(0),
+                                                      block, count=1)
                         content = content[:box.start()] + block + content[box.end():]
 
                     with open(filepath, 'w', encoding='utf-8') as f: